@@ -1,10 +1,14 @@
-from flask import Flask, request, jsonify
+from quart import Quart, Response, request, jsonify
+from werkzeug.utils import secure_filename
+import asyncio
+import functools
 import subprocess
 import json
 import os
 import time
 import logging
-import requests
+import httpx
+import orjson
 from datetime import datetime
 
 # Configure logging
@@ -14,16 +18,83 @@ logging.basicConfig(
     handlers=[logging.FileHandler("gto_service.log"), logging.StreamHandler()],
 )
 
-app = Flask(__name__)
+app = Quart(__name__)
 
 # Configuration
 GTO_PLUS_API_HOST = "localhost"
 GTO_PLUS_API_PORT = 8082
 GTO_PLUS_API_URL = f"http://{GTO_PLUS_API_HOST}:{GTO_PLUS_API_PORT}"
+MOCK_ANALYZE_DELAY = float(os.getenv("MOCK_ANALYZE_DELAY", "0"))  # Seconds
+UPLOAD_FOLDER = r"C:\temp\gto"
+
+# Shared async client so many in-flight GTO+ calls multiplex on one event loop.
+# httpx.AsyncClient is safe to use from concurrent requests, so it lives for the
+# whole process and is only closed on shutdown, never per request.
+GTO_CLIENT = httpx.AsyncClient(
+    base_url=GTO_PLUS_API_URL,
+    headers={"Content-Type": "application/json"},
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    timeout=httpx.Timeout(300),
+)
+
+
+@app.after_serving
+async def close_gto_client():
+    await GTO_CLIENT.aclose()
+
+
+def cached(timeout):
+    """Serve a route's last successful response from memory for `timeout` seconds"""
+
+    def decorator(view):
+        entry = {}
+
+        @functools.wraps(view)
+        async def wrapper(*args, **kwargs):
+            now = time.monotonic()
+            if entry and entry["expires"] > now:
+                return Response(entry["body"], content_type=entry["content_type"])
+
+            response = await app.make_response(await view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+
+            entry.update(
+                body=await response.get_data(),
+                content_type=response.content_type,
+                expires=now + timeout,
+            )
+            return Response(entry["body"], content_type=entry["content_type"])
+
+        return wrapper
+
+    return decorator
+
+
+async def stream_upstream(method, path, **kwargs):
+    """Send a request to the GTO+ API and relay its body without re-parsing it"""
+    upstream = await GTO_CLIENT.send(
+        GTO_CLIENT.build_request(method, path, **kwargs), stream=True
+    )
+
+    async def body():
+        try:
+            async for chunk in upstream.aiter_bytes(chunk_size=65536):
+                yield chunk
+        finally:
+            await upstream.aclose()
+
+    response = Response(
+        body(),
+        status=upstream.status_code,
+        content_type=upstream.headers.get("Content-Type", "application/json"),
+    )
+    return upstream, response
 
 
 @app.route("/health")
-def health_check():
+@cached(timeout=5)
+async def health_check():
     return jsonify(
         {
             "status": "healthy",
@@ -34,10 +105,10 @@ def health_check():
 
 
 @app.route("/gto/health")
-def gto_health_check():
+async def gto_health_check():
     """Check if GTO+ API is responding"""
     try:
-        response = requests.get(f"{GTO_PLUS_API_URL}/health", timeout=5)
+        response = await GTO_CLIENT.get("/health", timeout=5)
         if response.status_code == 200:
             return jsonify(
                 {
@@ -57,7 +128,7 @@ def gto_health_check():
                 ),
                 503,
             )
-    except requests.exceptions.RequestException as e:
+    except httpx.RequestError as e:
         logging.error(f"GTO+ API health check failed: {str(e)}")
         return (
             jsonify(
@@ -68,29 +139,29 @@ def gto_health_check():
 
 
 @app.route("/gto/solve", methods=["POST"])
-def gto_solve():
+async def gto_solve():
     """Forward solve requests to GTO+ API"""
     try:
         # Forward the request to GTO+ API
-        response = requests.post(
-            f"{GTO_PLUS_API_URL}/solve",
-            json=request.json,
-            headers={"Content-Type": "application/json"},
+        upstream, response = await stream_upstream(
+            "POST",
+            "/solve",
+            json=await request.get_json(),
             timeout=300,  # 5 minute timeout for solve
         )
 
-        logging.info(f"GTO+ solve request completed with status {response.status_code}")
+        logging.info(f"GTO+ solve request completed with status {upstream.status_code}")
 
-        # Return the response from GTO+
-        return jsonify(response.json()), response.status_code
+        # Stream the response from GTO+ back to the caller
+        return response
 
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         logging.error("GTO+ solve request timed out")
         return (
             jsonify({"error": "GTO+ solve request timed out", "status": "timeout"}),
             504,
         )
-    except requests.exceptions.RequestException as e:
+    except httpx.RequestError as e:
         logging.error(f"GTO+ solve request failed: {str(e)}")
         return (
             jsonify(
@@ -104,12 +175,13 @@ def gto_solve():
 
 
 @app.route("/gto/info")
-def gto_info():
+@cached(timeout=60)
+async def gto_info():
     """Get GTO+ solver information"""
     try:
-        response = requests.get(f"{GTO_PLUS_API_URL}/info", timeout=10)
-        return jsonify(response.json()), response.status_code
-    except requests.exceptions.RequestException as e:
+        upstream, response = await stream_upstream("GET", "/info", timeout=10)
+        return response
+    except httpx.RequestError as e:
         logging.error(f"GTO+ info request failed: {str(e)}")
         return (
             jsonify({"error": f"Failed to get GTO+ info: {str(e)}", "status": "error"}),
@@ -117,79 +189,115 @@ def gto_info():
         )
 
 
-@app.route("/api/analyze", methods=["POST"])
-def analyze_hand():
-    """Legacy mock analysis endpoint"""
-    try:
-        data = request.json
-        hand_id = data.get("hand_id", "unknown")
-        hand_history = data.get("hand_history", "")
-
-        logging.info(f"Received legacy analysis request for hand {hand_id}")
+async def mock_analysis(hand_id):
+    """Build the mock GTO+ analysis response for a hand"""
+    # Mock GTO+ analysis (replace with actual GTO+ command)
+    start_time = time.time()
 
-        # Save hand to temp file
-        temp_dir = "C:\\temp\\gto"
-        os.makedirs(temp_dir, exist_ok=True)
-        temp_file = os.path.join(temp_dir, f"hand_{hand_id}.txt")
-
-        with open(temp_file, "w") as f:
-            f.write(hand_history)
-
-        # Mock GTO+ analysis (replace with actual GTO+ command)
-        start_time = time.time()
-
-        # Simulate processing time
-        time.sleep(2)
-
-        # Mock solver output (replace with actual GTO+ results)
-        mock_output = {
-            "solver_output": f"Mock GTO+ analysis for hand {hand_id}\\n\\nPreflop Analysis:\\n- Position: Analysis based on hand history\\n- Range recommendations: Dynamically generated\\n- Frequency suggestions: Based on GTO principles",
-            "ranges": {
-                "CO": "77+, AJs+, AQo+, KQs",
-                "BB": "99+, AKo, AQs+, some KQs",
-                "BTN": "22+, A2+, K2+, Q2+, J2+",
-            },
-            "frequencies": {
-                "KK_5bet": 1.0,
-                "QQ_5bet": 0.52,
-                "QQ_call": 0.48,
-                "AKs_5bet": 0.41,
-                "AKs_call": 0.59,
-            },
-            "ev_analysis": {
-                "KK_flat_loss": -0.18,
-                "QQ_fold_loss": -0.22,
-                "AKs_5bet_fold_loss": -0.03,
-            },
-        }
+    # Optionally simulate processing time
+    if MOCK_ANALYZE_DELAY:
+        await asyncio.sleep(MOCK_ANALYZE_DELAY)
 
-        processing_time = time.time() - start_time
+    # Mock solver output (replace with actual GTO+ results)
+    mock_output = {
+        "solver_output": f"Mock GTO+ analysis for hand {hand_id}\\n\\nPreflop Analysis:\\n- Position: Analysis based on hand history\\n- Range recommendations: Dynamically generated\\n- Frequency suggestions: Based on GTO principles",
+        "ranges": {
+            "CO": "77+, AJs+, AQo+, KQs",
+            "BB": "99+, AKo, AQs+, some KQs",
+            "BTN": "22+, A2+, K2+, Q2+, J2+",
+        },
+        "frequencies": {
+            "KK_5bet": 1.0,
+            "QQ_5bet": 0.52,
+            "QQ_call": 0.48,
+            "AKs_5bet": 0.41,
+            "AKs_call": 0.59,
+        },
+        "ev_analysis": {
+            "KK_flat_loss": -0.18,
+            "QQ_fold_loss": -0.22,
+            "AKs_5bet_fold_loss": -0.03,
+        },
+    }
 
-        # Cleanup
-        try:
-            os.remove(temp_file)
-        except:
-            pass
+    processing_time = time.time() - start_time
 
-        logging.info(f"Completed analysis for hand {hand_id} in {processing_time:.2f}s")
+    logging.info(f"Completed analysis for hand {hand_id} in {processing_time:.2f}s")
 
-        return jsonify(
+    return Response(
+        orjson.dumps(
             {
                 **mock_output,
                 "processing_time": processing_time,
                 "status": "success",
                 "hand_id": hand_id,
             }
-        )
+        ),
+        mimetype="application/json",
+    )
+
+
+@app.route("/api/analyze", methods=["POST"])
+async def analyze_hand():
+    """Legacy mock analysis endpoint"""
+    try:
+        data = await request.get_json()
+        hand_id = data.get("hand_id", "unknown")
+
+        logging.info(f"Received legacy analysis request for hand {hand_id}")
+
+        return await mock_analysis(hand_id)
 
     except Exception as e:
         logging.error(f"Error processing hand: {str(e)}")
         return jsonify({"error": str(e), "status": "error"}), 500
 
 
+@app.route("/api/analyze/upload", methods=["POST"])
+async def analyze_hand_upload():
+    """Mock analysis endpoint taking the hand history as a multipart file upload"""
+    try:
+        files = await request.files
+        if "hand" not in files:
+            return jsonify({"error": "Missing 'hand' file", "status": "error"}), 400
+
+        form = await request.form
+        hand_id = form.get("hand_id", "unknown")
+
+        logging.info(f"Received upload analysis request for hand {hand_id}")
+
+        # Stream the uploaded history to disk in 64KB chunks rather than
+        # holding the whole session export in memory
+        os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+        hand_path = os.path.join(UPLOAD_FOLDER, secure_filename(f"hand_{hand_id}.txt"))
+        await files["hand"].save(hand_path, 65536)
+
+        try:
+            return await mock_analysis(hand_id)
+        finally:
+            os.remove(hand_path)
+
+    except Exception as e:
+        logging.error(f"Error processing uploaded hand: {str(e)}")
+        return jsonify({"error": str(e), "status": "error"}), 500
+
+
 if __name__ == "__main__":
     # This will be replaced by Ansible template variables
     service_port = 8080  # Default port, will be templated
     logging.info(f"Starting GTO+ Service on port {service_port}")
     logging.info(f"GTO+ API URL: {GTO_PLUS_API_URL}")
-    app.run(host="0.0.0.0", port=service_port, debug=False)
+
+    # Serve with Hypercorn rather than the dev server so long-running solves
+    # don't serialize other requests; keep-alive and graceful timeouts are
+    # sized for solves that can take up to 5 minutes.
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+
+    config = Config()
+    config.bind = [f"0.0.0.0:{service_port}"]
+    config.keep_alive_timeout = 75
+    config.graceful_timeout = 360
+    config.read_timeout = 360
+    config.accesslog = None
+    asyncio.run(serve(app, config))
@@ -2,13 +2,13 @@
 """
 Debug script to test WinRM connection directly
 """
-import winrm
-import yaml
 import os
 import getpass
 
 # Read configuration from inventory.yml
 try:
+    import yaml
+
     with open("ansible/inventory.yml", "r") as f:
         inventory = yaml.safe_load(f)
 
@@ -31,22 +31,56 @@ print(f"Testing WinRM connection to {host}:{port}")
 print(f"Username: {username}")
 print(f"Password: {'*' * len(password)}")
 
+# Commands to run over a single WinRM shell
+COMMANDS = [
+    ("echo", ["Hello from Windows"]),
+    ("hostname", []),
+    ("whoami", []),
+]
+
+# Re-open the shell periodically to stay under the WinRM operations quota
+MAX_OPERATIONS_PER_SHELL = 1000
+
 try:
-    # Create WinRM session
-    session = winrm.Session(
-        f"http://{host}:{port}/wsman", auth=(username, password), transport="basic"
+    import winrm
+
+    # Open one WinRM shell and reuse it for every command
+    protocol = winrm.Protocol(
+        endpoint=f"http://{host}:{port}/wsman",
+        transport="basic",
+        username=username,
+        password=password,
     )
+    shell_id = protocol.open_shell()
+    operations = 0
+    all_ok = True
+
+    try:
+        for command, arguments in COMMANDS:
+            if operations >= MAX_OPERATIONS_PER_SHELL:
+                protocol.close_shell(shell_id)
+                shell_id = protocol.open_shell()
+                operations = 0
+
+            command_id = protocol.run_command(shell_id, command, arguments)
+            std_out, std_err, status_code = protocol.get_command_output(
+                shell_id, command_id
+            )
+            protocol.cleanup_command(shell_id, command_id)
+            operations += 1
 
-    # Test basic command
-    result = session.run_cmd('echo "Hello from Windows"')
+            if status_code == 0:
+                print(f"Output ({command}): {std_out.decode().strip()}")
+            else:
+                all_ok = False
+                print(f"❌ Command failed: {command}")
+                print(f"Status: {status_code}")
+                print(f"Error: {std_err.decode()}")
+    finally:
+        protocol.close_shell(shell_id)
 
-    if result.status_code == 0:
+    if all_ok:
         print("✅ Connection successful!")
-        print(f"Output: {result.std_out.decode().strip()}")
-    else:
-        print("❌ Command failed")
-        print(f"Status: {result.status_code}")
-        print(f"Error: {result.std_err.decode()}")
 
 except Exception as e:
     print(f"❌ Connection failed: {e}")
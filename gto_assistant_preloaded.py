@@ -16,26 +16,205 @@ Required:
 """
 
 import os
-import json
-import glob
-import requests
+import re
+import fnmatch
+import time
+import hashlib
+import functools
+import itertools
+import queue
+import threading
+import logging
+import sys
+import asyncio
+import httpx
+import orjson
+import zstandard as zstd
+import blake3
+import numpy as np
+import numba
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, NamedTuple, Optional
 from dataclasses import dataclass
-from openai import OpenAI
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Progress output goes through one logger so it can be level-filtered
+log = logging.getLogger("gto")
+if not log.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(_handler)
+    log.setLevel(logging.INFO)
+    # Our handler already prints; don't repeat lines through a root handler
+    # installed by the host (waitress, pytest, basicConfig)
+    log.propagate = False
+
 # Configuration
 MODEL = "gpt-4o"
 TEMPERATURE = 0.3
 GTO_SOLVER_URL = os.getenv("GTO_SOLVER_URL", "http://your-windows-node:8080")
 INPUT_FOLDER = "hands"
 OUTPUT_FOLDER = "exports"
+RAW_FOLDER = "raw"  # Hand history sidecars, relative to OUTPUT_FOLDER
 DEBUG_FOLDER = "debug"
+CACHE_FOLDER = "cache"
+ARCHIVE_SUFFIX = ".json.zst"  # Analysis exports: zstd-compressed compact JSON
+ARCHIVE_LEVEL = 3
+SOLVER_CACHE_MAX_AGE = 86400  # Re-solve cached hands after one day
+CHATGPT_CACHE_MAX_AGE = 7 * 86400  # Re-ask ChatGPT for cached prompts after a week
+MAX_CONCURRENT_HANDS = 4  # Hands in flight at the GTO+ solver at once
+SOLVER_RETRIES = 3  # Retries for transient gateway errors from the solver
+SOLVER_RETRY_BACKOFF = 0.5  # Seconds, doubled after each retry
+SOLVER_RETRY_STATUSES = {502, 503, 504}
+MAX_CONCURRENT_ANALYSES = 10  # ChatGPT requests in flight at once
+
+# Hand history header fields: hand ID, stakes and game type, in any order
+HEADER_RE = re.compile(r"Hand #(\d+)|\$([\d.]+)/\$([\d.]+)|\b(Holdem|Omaha)\b")
+GAME_TYPES = {"Holdem": "Texas Hold'em", "Omaha": "Omaha"}
+
+# ChatGPT analysis prompt, rendered per hand with format_map
+ANALYSIS_PROMPT = """
+Analyze this poker hand from Roughneck7's perspective as the hero. Focus exclusively on Roughneck7's decisions and strategy.
+
+HAND DETAILS:
+- Hand ID: {hand_id}
+- Stakes: {stakes}
+- Game: {game_type}
+- Hero: Roughneck7
+
+HAND HISTORY:
+{raw_history}
+
+SOLVER ANALYSIS:
+{solver_output}
+
+RANGES:
+{ranges}
+
+FREQUENCIES:
+{frequencies}
+
+EV ANALYSIS:
+{ev_analysis}
+
+Please provide analysis focused ONLY on Roughneck7's play using these formatting guidelines:
+
+**CARD SUITS**: Use ♠ ♥ ♦ ♣ symbols when referencing specific cards or suits
+**MOVE INDICATORS**:
+- ✅ Excellent/Optimal GTO play
+- ⚠️ Suboptimal but acceptable
+- ❌ Clear mistake/poor decision
+- 💡 Learning opportunity/interesting spot
+- 🎯 Key strategic insight
+- 💰 EV impact (positive/negative)
+- 🔍 Hand reading point
+- ⏰ Timing tell or bet sizing note
+
+**ANALYSIS SECTIONS**:
+
+## ♠ Roughneck7's Strategic Assessment
+Evaluate each of Roughneck7's decisions with move indicators and suit symbols where applicable.
+
+## ♥ GTO Alignment Analysis
+How well did Roughneck7's actions align with GTO recommendations? Use ✅/⚠️/❌ for each decision.
+
+## ♦ EV Impact Breakdown
+What was the EV impact of Roughneck7's specific decisions? Use 💰 for each EV calculation.
+
+## ♣ Alternative Lines & Options
+What other options did Roughneck7 have at each decision point? Use 💡 for interesting alternatives.
+
+## 🎯 Key Learning Points
+Critical takeaways for Roughneck7 to improve in similar spots. Use 💡 for each learning point.
+
+**FORMATTING REQUIREMENTS**:
+- Always use suit symbols (♠ ♥ ♦ ♣) when mentioning specific cards
+- Mark every decision with ✅/⚠️/❌ based on GTO alignment
+- Use 💰 before every EV calculation or monetary impact
+- Use 💡 for learning opportunities and insights
+- Use 🔍 for hand reading analysis
+- Use ⏰ for timing or bet sizing observations
+- Use 🎯 for strategic insights
+
+IMPORTANT: 
+- Ignore opponent play analysis unless it directly impacts Roughneck7's decisions
+- Focus on actionable insights for Roughneck7's improvement
+- Provide specific hand reading and range analysis from Roughneck7's perspective
+- Include bet sizing analysis and timing tells if relevant to Roughneck7's decisions
+- Make the analysis visually engaging with consistent emoji usage
+
+Format your response with clear sections, suit symbols, and emojis for easy scanning and learning.
+"""
+
+
+def _dump(obj, path) -> None:
+    """Write obj to path as indented JSON"""
+    Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+
+
+def _dump_archive(obj, path) -> None:
+    """Write obj to a new file at path as zstd-compressed compact JSON
+
+    The file is opened exclusively so an export is never silently replaced.
+    """
+    compressor = zstd.ZstdCompressor(level=ARCHIVE_LEVEL)
+    with open(path, "xb") as f:
+        f.write(compressor.compress(orjson.dumps(obj)))
+
+
+def _load(path):
+    """Read a JSON file, decompressing .zst archives"""
+    data = Path(path).read_bytes()
+    if str(path).endswith(".zst"):
+        data = zstd.ZstdDecompressor().decompress(data)
+    return orjson.loads(data)
+
+
+@numba.njit(cache=True, fastmath=True)
+def _dev_core(ev: np.ndarray, freqs: np.ndarray) -> float:
+    """Deviation score over numeric EV and frequency values"""
+    score = 0.0
+    for value in ev:
+        # Negative EV indicates suboptimal play; scale the impact
+        if value < 0:
+            score -= value * 10
+    for freq in freqs:
+        # Pure strategies and mixed strategies both mark interesting spots
+        if freq == 1.0 or freq == 0.0:
+            score += 0.5
+        elif 0.3 <= freq <= 0.7:
+            score += 0.2
+    return score
+
+
+@functools.lru_cache(maxsize=2048)
+def _load_gto_json(filepath: str, mtime: float) -> dict:
+    """Read a GTO analysis file; mtime is part of the key so rewrites are re-read
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    return _load(filepath)
+
+
+@functools.lru_cache(maxsize=1)
+def _scan_gto_files(folder_mtime: int) -> tuple:
+    """Scan for GTO analysis files for a given OUTPUT_FOLDER modification time"""
+    with os.scandir(OUTPUT_FOLDER) as entries:
+        return tuple(
+            entry.path
+            for entry in entries
+            if entry.name.startswith("gto_analysis_")
+            and entry.name.endswith((".json", ARCHIVE_SUFFIX))
+        )
+
+
+def _list_gto_files() -> tuple:
+    """GTO analysis files in OUTPUT_FOLDER, re-scanned only when it changes"""
+    return _scan_gto_files(os.stat(OUTPUT_FOLDER).st_mtime_ns)
 
 
 class DebugLogger:
@@ -53,19 +232,48 @@ class DebugLogger:
         for folder in [self.gto_logs, self.chatgpt_logs, self.raw_requests]:
             folder.mkdir(exist_ok=True)
 
+        # One clock read per session; the counter keeps log names unique and ordered
+        self._session_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._counter = itertools.count()
+
+        # Log writes are queued and done by one background writer thread, so
+        # callers never wait on disk I/O
+        self._queue = queue.Queue()
+        threading.Thread(target=self._writer_loop, daemon=True).start()
+
+    def _writer_loop(self):
+        """Perform queued log writes in order"""
+        while True:
+            write, args = self._queue.get()
+            try:
+                write(*args)
+            except Exception as e:
+                log.error("   ❌ Failed to write debug log: %s", e)
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """Block until every queued log write is on disk"""
+        self._queue.join()
+
+    def _next_timestamp(self) -> str:
+        """Session timestamp plus a sequence number for the next log file"""
+        return f"{self._session_ts}_{next(self._counter):06d}"
+
     def log_gto_output(self, hand_id: str, raw_request: dict, raw_response: dict):
         """Log GTO+ solver request and response"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._queue.put((self._write_gto_output, (hand_id, raw_request, raw_response)))
+
+    def _write_gto_output(self, hand_id: str, raw_request: dict, raw_response: dict):
+        timestamp = self._next_timestamp()
 
         # Log the raw request
         request_file = self.raw_requests / f"gto_request_{hand_id}_{timestamp}.json"
-        with open(request_file, "w", encoding="utf-8") as f:
-            json.dump(raw_request, f, indent=2)
+        _dump(raw_request, request_file)
 
         # Log the raw response
         response_file = self.gto_logs / f"gto_response_{hand_id}_{timestamp}.json"
-        with open(response_file, "w", encoding="utf-8") as f:
-            json.dump(raw_response, f, indent=2)
+        _dump(raw_response, response_file)
 
         # Log just the solver output text for easy reading
         solver_output = raw_response.get("solver_output", "")
@@ -77,11 +285,16 @@ class DebugLogger:
                 f.write("=" * 60 + "\n")
                 f.write(solver_output)
 
-        print(f"   📝 GTO+ logs saved to {self.gto_logs}/")
+        log.info("   📝 GTO+ logs saved to %s/", self.gto_logs)
 
     def log_chatgpt_interaction(self, hand_id: str, messages: list, response: str):
         """Log ChatGPT API request and response"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._queue.put(
+            (self._write_chatgpt_interaction, (hand_id, messages, response))
+        )
+
+    def _write_chatgpt_interaction(self, hand_id: str, messages: list, response: str):
+        timestamp = self._next_timestamp()
 
         # Log the full interaction
         interaction_data = {
@@ -101,8 +314,7 @@ class DebugLogger:
         interaction_file = (
             self.chatgpt_logs / f"chatgpt_interaction_{hand_id}_{timestamp}.json"
         )
-        with open(interaction_file, "w", encoding="utf-8") as f:
-            json.dump(interaction_data, f, indent=2)
+        _dump(interaction_data, interaction_file)
 
         # Log just the prompt for easy reading
         prompt_file = self.chatgpt_logs / f"chatgpt_prompt_{hand_id}_{timestamp}.txt"
@@ -130,13 +342,18 @@ class DebugLogger:
             f.write("=" * 60 + "\n")
             f.write(response)
 
-        print(f"   📝 ChatGPT logs saved to {self.chatgpt_logs}/")
+        log.info("   📝 ChatGPT logs saved to %s/", self.chatgpt_logs)
 
     def log_error(
         self, component: str, hand_id: str, error: Exception, context: dict = None
     ):
         """Log errors with context"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._queue.put((self._write_error, (component, hand_id, error, context)))
+
+    def _write_error(
+        self, component: str, hand_id: str, error: Exception, context: dict = None
+    ):
+        timestamp = self._next_timestamp()
         error_file = self.debug_folder / f"error_{component}_{hand_id}_{timestamp}.json"
 
         error_data = {
@@ -148,37 +365,64 @@ class DebugLogger:
             "context": context or {},
         }
 
-        with open(error_file, "w", encoding="utf-8") as f:
-            json.dump(error_data, f, indent=2)
+        _dump(error_data, error_file)
 
-        print(f"   📝 Error logged to {error_file}")
+        log.info("   📝 Error logged to %s", error_file)
 
     def create_session_summary(self, session_results: list):
         """Create a summary of the entire processing session"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._queue.put((self._write_session_summary, (session_results,)))
+
+    def _write_session_summary(self, session_results: list):
+        timestamp = self._next_timestamp()
         summary_file = self.debug_folder / f"session_summary_{timestamp}.json"
 
+        successful = sum(1 for r in session_results if r.get("status") == "success")
+
         summary_data = {
             "session_timestamp": timestamp,
             "total_hands_processed": len(session_results),
-            "successful_hands": len(
-                [r for r in session_results if r.get("status") == "success"]
-            ),
-            "failed_hands": len(
-                [r for r in session_results if r.get("status") != "success"]
-            ),
+            "successful_hands": successful,
+            "failed_hands": len(session_results) - successful,
             "gto_solver_url": GTO_SOLVER_URL,
             "model_used": MODEL,
             "results": session_results,
         }
 
-        with open(summary_file, "w", encoding="utf-8") as f:
-            json.dump(summary_data, f, indent=2)
+        _dump(summary_data, summary_file)
 
-        print(f"📝 Session summary saved to {summary_file}")
+        log.info("📝 Session summary saved to %s", summary_file)
 
 
-@dataclass
+class ResponseCache:
+    """On-disk cache of solver and ChatGPT responses keyed by request hash"""
+
+    def __init__(self, cache_folder: str, max_age: Optional[float] = None):
+        self.cache_folder = Path(cache_folder)
+        self.cache_folder.mkdir(parents=True, exist_ok=True)
+        self.max_age = max_age
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        """Build a cache key from the request contents"""
+        return hashlib.sha256("".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        """Return the cached value, or None if missing or expired"""
+        path = self.cache_folder / f"{key}.json"
+        try:
+            if self.max_age and time.time() - path.stat().st_mtime > self.max_age:
+                return None
+            return _load(path)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value):
+        """Store a value under the given key"""
+        (self.cache_folder / f"{key}.json").write_bytes(orjson.dumps(value))
+
+
+@dataclass(slots=True, frozen=True)
 class HandData:
     """Structure for poker hand data"""
 
@@ -191,7 +435,7 @@ class HandData:
     raw_history: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SolverResult:
     """Structure for GTO solver results"""
 
@@ -203,28 +447,52 @@ class SolverResult:
     processing_time: float
 
 
+class HandFile(NamedTuple):
+    """A discovered hand file: full path plus its file name"""
+
+    path: str
+    name: str
+
+
 class HandParser:
     """Parse poker hand histories from various formats"""
 
     @staticmethod
-    def parse_hand_file(filepath: str) -> HandData:
-        """Parse a single hand file"""
+    def iter_hand_files(folder: str, pattern: str) -> Iterator[HandFile]:
+        """Yield hand files in folder matching pattern as they are found"""
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if (
+                    not entry.name.startswith(".")
+                    and fnmatch.fnmatch(entry.name, pattern)
+                    and entry.is_file()
+                ):
+                    yield HandFile(entry.path, entry.name)
+
+    @staticmethod
+    def parse_hand_file(filepath: str, timestamp: Optional[str] = None) -> HandData:
+        """Parse a single hand file, stamping it with timestamp (default: now)"""
         with open(filepath, "r", encoding="utf-8") as f:
             content = f.read()
 
         # Extract basic info (customize based on your hand format)
-        lines = content.strip().split("\n")
-        header = lines[0] if lines else ""
-
-        # Basic parsing - adapt to your hand history format
-        hand_id = HandParser._extract_hand_id(header)
-        timestamp = HandParser._extract_timestamp(header)
-        stakes = HandParser._extract_stakes(header)
-        game_type = HandParser._extract_game_type(header)
+        header = content.lstrip().partition("\n")[0]
+
+        # Single scan of the header, e.g. "Hand #2517850956 - Holdem (No Limit) - $0.05/$0.10"
+        hand_id = stakes = game_type = "unknown"
+        for match in HEADER_RE.finditer(header):
+            match_id, small_blind, big_blind, game = match.groups()
+            if match_id and hand_id == "unknown":
+                hand_id = match_id
+            elif small_blind and stakes == "unknown":
+                stakes = f"${small_blind}/${big_blind}"
+            elif game and game_type == "unknown":
+                game_type = GAME_TYPES[game]
 
         return HandData(
             hand_id=hand_id,
-            timestamp=timestamp,
+            # Customize based on your format
+            timestamp=timestamp or datetime.now().isoformat(),
             stakes=stakes,
             game_type=game_type,
             positions={},  # TODO: Parse positions
@@ -232,52 +500,51 @@ class HandParser:
             raw_history=content,
         )
 
-    @staticmethod
-    def _extract_hand_id(header: str) -> str:
-        """Extract hand ID from header"""
-        # Example: "Hand #2517850956 - ..."
-        try:
-            return header.split("#")[1].split(" ")[0]
-        except:
-            return "unknown"
-
-    @staticmethod
-    def _extract_timestamp(header: str) -> str:
-        """Extract timestamp from header"""
-        # Customize based on your format
-        return datetime.now().isoformat()
-
-    @staticmethod
-    def _extract_stakes(header: str) -> str:
-        """Extract stakes from header"""
-        # Example: "$0.05/$0.10"
-        try:
-            parts = header.split("$")
-            if len(parts) >= 3:
-                return f"${parts[1]}/{parts[2].split(' ')[0]}"
-        except:
-            pass
-        return "unknown"
 
-    @staticmethod
-    def _extract_game_type(header: str) -> str:
-        """Extract game type from header"""
-        if "Holdem" in header:
-            return "Texas Hold'em"
-        elif "Omaha" in header:
-            return "Omaha"
-        return "unknown"
+class SolverUnavailable(Exception):
+    """Raised when the remote GTO+ solver cannot be reached at all"""
 
 
 class GTOSolverClient:
-    """Client for remote GTO+ solver on Windows"""
+    """Client for remote GTO+ solver on Windows
+
+    Use as an async context manager so a single pooled connection set is
+    shared by every hand submitted during a batch.
+    """
 
-    def __init__(self, solver_url: str, debug_logger: DebugLogger = None):
+    def __init__(
+        self,
+        solver_url: str,
+        debug_logger: DebugLogger = None,
+        cache: ResponseCache = None,
+    ):
         self.solver_url = solver_url
-        self.session = requests.Session()
         self.debug_logger = debug_logger
+        self.cache = cache
+        self.client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self):
+        # Size the connection pool for batch runs and retry failed connects;
+        # HTTP/2 multiplexes concurrent hands on one connection where the
+        # solver endpoint negotiates it (TLS), otherwise HTTP/1.1 is used
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            retries=3,
+        )
+        self.client = httpx.AsyncClient(
+            base_url=self.solver_url,
+            headers={"User-Agent": "gto-assistant/1.0"},
+            transport=transport,
+            timeout=httpx.Timeout(300.0, connect=10.0),  # 5 minutes per solve
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.client.aclose()
+        self.client = None
 
-    def submit_hand(self, hand_data: HandData) -> Optional[SolverResult]:
+    async def submit_hand(self, hand_data: HandData) -> Optional[SolverResult]:
         """Submit hand to remote GTO+ solver"""
         try:
             payload = {
@@ -287,57 +554,107 @@ class GTOSolverClient:
                 "analysis_depth": "full",
             }
 
-            response = self.session.post(
-                f"{self.solver_url}/api/analyze",
-                json=payload,
-                timeout=300,  # 5 minutes timeout
+            # Keyed on the solver too, so switching GTO_SOLVER_URL between the
+            # mock service and a real GTO+ node never serves the other's results
+            cache_key = ResponseCache.key(
+                self.solver_url.rstrip("/"),
+                orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode(),
+            )
+            result = (
+                await asyncio.to_thread(self.cache.get, cache_key)
+                if self.cache
+                else None
             )
 
-            if response.status_code == 200:
+            if result is not None:
+                log.info(
+                    "   ♻️  Using cached GTO+ result for hand %s", hand_data.hand_id
+                )
+            else:
+                response = await self._post("/api/analyze", payload)
+
+                if response.status_code != 200:
+                    log.error(
+                        "❌ Solver error: %s - %s", response.status_code, response.text
+                    )
+                    return None
+
                 result = response.json()
+                if self.cache:
+                    await asyncio.to_thread(self.cache.set, cache_key, result)
 
                 # Log GTO+ output if debug logger is available
                 if self.debug_logger:
                     self.debug_logger.log_gto_output(hand_data.hand_id, payload, result)
 
-                return SolverResult(
-                    hand_id=hand_data.hand_id,
-                    solver_output=result.get("solver_output", ""),
-                    ranges=result.get("ranges", {}),
-                    frequencies=result.get("frequencies", {}),
-                    ev_analysis=result.get("ev_analysis", {}),
-                    processing_time=result.get("processing_time", 0.0),
-                )
-            else:
-                print(f"❌ Solver error: {response.status_code} - {response.text}")
-                return None
+            return SolverResult(
+                hand_id=hand_data.hand_id,
+                solver_output=result.get("solver_output", ""),
+                ranges=result.get("ranges", {}),
+                frequencies=result.get("frequencies", {}),
+                ev_analysis=result.get("ev_analysis", {}),
+                processing_time=result.get("processing_time", 0.0),
+            )
 
-        except requests.exceptions.RequestException as e:
-            print(f"❌ Connection error: {e}")
+        except httpx.ConnectError as e:
+            # Nothing is listening; fail the whole batch rather than every hand
+            raise SolverUnavailable(str(e)) from e
+        except httpx.RequestError as e:
+            log.error("❌ Connection error: %s", e)
             if self.debug_logger:
                 self.debug_logger.log_error(
                     "gto_solver", hand_data.hand_id, e, {"payload": payload}
                 )
             return None
 
-    def health_check(self) -> bool:
-        """Check if remote solver is available"""
-        try:
-            response = self.session.get(f"{self.solver_url}/health", timeout=10)
-            return response.status_code == 200
-        except:
-            return False
+    async def _post(self, path: str, payload: dict) -> httpx.Response:
+        """POST to the solver, retrying gateway errors with exponential backoff"""
+        for attempt in range(SOLVER_RETRIES + 1):
+            response = await self.client.post(path, json=payload)
+            if (
+                response.status_code not in SOLVER_RETRY_STATUSES
+                or attempt == SOLVER_RETRIES
+            ):
+                return response
+            await asyncio.sleep(SOLVER_RETRY_BACKOFF * 2**attempt)
 
 
 class AIAnalyzer:
-    """AI-powered analysis of solver results"""
+    """AI-powered analysis of solver results
+
+    Use as an async context manager so one AsyncOpenAI client serves every
+    hand analyzed during a batch.
+    """
 
-    def __init__(self, client: OpenAI, debug_logger: DebugLogger = None):
-        self.client = client
+    def __init__(
+        self,
+        api_key: str,
+        debug_logger: DebugLogger = None,
+        cache: ResponseCache = None,
+    ):
+        self.api_key = api_key
         self.debug_logger = debug_logger
+        self.cache = cache
+        self.client = None
 
-    def analyze_hand(self, hand_data: HandData, solver_result: SolverResult) -> str:
-        """Analyze hand using AI"""
+    async def __aenter__(self):
+        # Deferred so commands that never reach ChatGPT skip the OpenAI SDK import
+        from openai import AsyncOpenAI
+
+        self.client = AsyncOpenAI(api_key=self.api_key)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.client.close()
+        self.client = None
+
+    async def analyze_hand(
+        self, hand_data: HandData, solver_result: SolverResult, force: bool = False
+    ) -> str:
+        """Analyze hand using AI
+
+        force skips the cached response and stores the fresh one in its place.
+        """
         messages = [
             {
                 "role": "system",
@@ -349,13 +666,31 @@ class AIAnalyzer:
             },
         ]
 
-        response = self.client.chat.completions.create(
-            model=MODEL,
-            temperature=TEMPERATURE,
-            messages=messages,
+        request = {"model": MODEL, "temperature": TEMPERATURE, "messages": messages}
+
+        # Identical requests on re-runs reuse the stored response; every
+        # parameter is part of the key so changing one misses the cache
+        cache_key = ResponseCache.key(
+            orjson.dumps(request, option=orjson.OPT_SORT_KEYS).decode()
+        )
+        cached = (
+            await asyncio.to_thread(self.cache.get, cache_key)
+            if self.cache and not force
+            else None
         )
+        if cached is not None:
+            log.info(
+                "   ♻️  Using cached ChatGPT analysis for hand %s", hand_data.hand_id
+            )
+            return cached["response"]
+
+        response = await self.client.chat.completions.create(**request)
 
         response_text = response.choices[0].message.content
+        if self.cache:
+            await asyncio.to_thread(
+                self.cache.set, cache_key, {"response": response_text}
+            )
 
         # Log ChatGPT interaction if debug logger is available
         if self.debug_logger:
@@ -369,216 +704,228 @@ class AIAnalyzer:
         self, hand_data: HandData, solver_result: SolverResult
     ) -> str:
         """Build analysis prompt for AI"""
-        return f"""
-Analyze this poker hand from Roughneck7's perspective as the hero. Focus exclusively on Roughneck7's decisions and strategy.
-
-HAND DETAILS:
-- Hand ID: {hand_data.hand_id}
-- Stakes: {hand_data.stakes}
-- Game: {hand_data.game_type}
-- Hero: Roughneck7
-
-HAND HISTORY:
-{hand_data.raw_history}
-
-SOLVER ANALYSIS:
-{solver_result.solver_output}
-
-RANGES:
-{json.dumps(solver_result.ranges, indent=2)}
-
-FREQUENCIES:
-{json.dumps(solver_result.frequencies, indent=2)}
-
-EV ANALYSIS:
-{json.dumps(solver_result.ev_analysis, indent=2)}
-
-Please provide analysis focused ONLY on Roughneck7's play using these formatting guidelines:
-
-**CARD SUITS**: Use ♠ ♥ ♦ ♣ symbols when referencing specific cards or suits
-**MOVE INDICATORS**:
-- ✅ Excellent/Optimal GTO play
-- ⚠️ Suboptimal but acceptable
-- ❌ Clear mistake/poor decision
-- 💡 Learning opportunity/interesting spot
-- 🎯 Key strategic insight
-- 💰 EV impact (positive/negative)
-- 🔍 Hand reading point
-- ⏰ Timing tell or bet sizing note
-
-**ANALYSIS SECTIONS**:
-
-## ♠ Roughneck7's Strategic Assessment
-Evaluate each of Roughneck7's decisions with move indicators and suit symbols where applicable.
-
-## ♥ GTO Alignment Analysis
-How well did Roughneck7's actions align with GTO recommendations? Use ✅/⚠️/❌ for each decision.
-
-## ♦ EV Impact Breakdown
-What was the EV impact of Roughneck7's specific decisions? Use 💰 for each EV calculation.
-
-## ♣ Alternative Lines & Options
-What other options did Roughneck7 have at each decision point? Use 💡 for interesting alternatives.
-
-## 🎯 Key Learning Points
-Critical takeaways for Roughneck7 to improve in similar spots. Use 💡 for each learning point.
-
-**FORMATTING REQUIREMENTS**:
-- Always use suit symbols (♠ ♥ ♦ ♣) when mentioning specific cards
-- Mark every decision with ✅/⚠️/❌ based on GTO alignment
-- Use 💰 before every EV calculation or monetary impact
-- Use 💡 for learning opportunities and insights
-- Use 🔍 for hand reading analysis
-- Use ⏰ for timing or bet sizing observations
-- Use 🎯 for strategic insights
-
-IMPORTANT: 
-- Ignore opponent play analysis unless it directly impacts Roughneck7's decisions
-- Focus on actionable insights for Roughneck7's improvement
-- Provide specific hand reading and range analysis from Roughneck7's perspective
-- Include bet sizing analysis and timing tells if relevant to Roughneck7's decisions
-- Make the analysis visually engaging with consistent emoji usage
-
-Format your response with clear sections, suit symbols, and emojis for easy scanning and learning.
-"""
+        return ANALYSIS_PROMPT.format_map(
+            {
+                "hand_id": hand_data.hand_id,
+                "stakes": hand_data.stakes,
+                "game_type": hand_data.game_type,
+                "raw_history": hand_data.raw_history,
+                "solver_output": solver_result.solver_output,
+                "ranges": orjson.dumps(solver_result.ranges).decode(),
+                "frequencies": orjson.dumps(solver_result.frequencies).decode(),
+                "ev_analysis": orjson.dumps(solver_result.ev_analysis).decode(),
+            }
+        )
 
 
 class GTOAssistant:
     """Main application class"""
 
     def __init__(self):
-        # Initialize OpenAI client with API key validation
+        # Validate the OpenAI API key; the client is opened per AI batch
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY not found in environment")
 
-        self.openai_client = OpenAI(api_key=api_key)
         self.debug_logger = DebugLogger()
         self.parser = HandParser()
-        self.solver = GTOSolverClient(GTO_SOLVER_URL, self.debug_logger)
-        self.analyzer = AIAnalyzer(self.openai_client, self.debug_logger)
+        self.solver = GTOSolverClient(
+            GTO_SOLVER_URL,
+            self.debug_logger,
+            ResponseCache(
+                os.path.join(CACHE_FOLDER, "solver"), max_age=SOLVER_CACHE_MAX_AGE
+            ),
+        )
+        self.analyzer = AIAnalyzer(
+            api_key,
+            self.debug_logger,
+            ResponseCache(
+                os.path.join(CACHE_FOLDER, "chatgpt"), max_age=CHATGPT_CACHE_MAX_AGE
+            ),
+        )
+
+        # Compile the deviation scorer now rather than on the first solved hand
+        _dev_core(np.zeros(1), np.zeros(1))
 
         # Create required directories
         Path(INPUT_FOLDER).mkdir(exist_ok=True)
-        Path(OUTPUT_FOLDER).mkdir(exist_ok=True)
+        Path(OUTPUT_FOLDER, RAW_FOLDER).mkdir(parents=True, exist_ok=True)
 
-    def process_gto_analysis(self, pattern: str = "*.txt") -> List[Dict]:
+    def process_gto_analysis(
+        self, pattern: str = "*.txt", max_workers: int = MAX_CONCURRENT_HANDS
+    ) -> List[Dict]:
         """Step 1: Run GTO+ analysis only, save solver results"""
-        hand_files = glob.glob(os.path.join(INPUT_FOLDER, pattern))
+        try:
+            return asyncio.run(self._process_gto_analysis(pattern, max_workers))
+        finally:
+            self.debug_logger.flush()
+
+    async def _process_gto_analysis(self, pattern: str, max_workers: int) -> List[Dict]:
+        """Submit every hand file to the solver concurrently"""
         results = []
 
-        if not hand_files:
-            print(f"❌ No hand files found in {INPUT_FOLDER}/")
-            return results
+        async with self.solver:
+            semaphore = asyncio.Semaphore(max_workers)
+            batch_timestamp = datetime.now().isoformat()
 
-        print(f"🔍 Found {len(hand_files)} hand files to process with GTO+ solver")
+            async def process_one(i: int, hand_file: HandFile) -> Dict:
+                async with semaphore:
+                    return await self._process_gto_hand(i, hand_file, batch_timestamp)
 
-        # Check solver availability
-        if not self.solver.health_check():
-            print(f"❌ Remote GTO+ solver not available at {GTO_SOLVER_URL}")
-            print("   Please check your Windows node connection")
-            return results
+            # Queue hands as they are discovered so solver calls start during the scan
+            tasks = []
+            for i, hand_file in enumerate(
+                self.parser.iter_hand_files(INPUT_FOLDER, pattern), 1
+            ):
+                tasks.append(asyncio.create_task(process_one(i, hand_file)))
+                await asyncio.sleep(0)
 
-        for i, filepath in enumerate(hand_files, 1):
-            print(
-                f"\n📊 Processing GTO analysis {i}/{len(hand_files)}: {os.path.basename(filepath)}"
-            )
+            if not tasks:
+                log.error("❌ No hand files found in %s/", INPUT_FOLDER)
+                return results
 
+            log.info("🔍 Found %s hand files to process with GTO+ solver", len(tasks))
             try:
-                # Parse hand
-                hand_data = self.parser.parse_hand_file(filepath)
-                print(f"   Hand ID: {hand_data.hand_id}")
-
-                # Submit to solver
-                print("   🔄 Submitting to GTO+ solver...")
-                solver_result = self.solver.submit_hand(hand_data)
-
-                if not solver_result:
-                    print("   ❌ Solver analysis failed")
-                    results.append(
-                        {
-                            "hand_id": hand_data.hand_id,
-                            "status": "solver_failed",
-                            "error": "GTO+ solver returned no result",
-                        }
-                    )
-                    continue
-
-                print(f"   ✅ Solver completed in {solver_result.processing_time:.1f}s")
-
-                # Save GTO-only results
-                result = self._save_gto_analysis(hand_data, solver_result)
-                results.append(result)
-
-                print(f"   ✅ GTO analysis saved to {result['output_file']}")
-
-                # Calculate deviation score for prioritization
-                deviation_score = self._calculate_deviation_score(solver_result)
-                result["deviation_score"] = deviation_score
-                print(f"   📈 Deviation score: {deviation_score:.2f}")
-
-            except Exception as e:
-                print(f"   ❌ Error processing {filepath}: {e}")
-                self.debug_logger.log_error(
-                    "gto_processing",
-                    hand_data.hand_id if "hand_data" in locals() else "unknown",
-                    e,
-                    {"filepath": filepath},
-                )
-                results.append(
-                    {
-                        "hand_id": (
-                            hand_data.hand_id if "hand_data" in locals() else "unknown"
-                        ),
-                        "status": "error",
-                        "error": str(e),
-                    }
-                )
-                continue
+                results = list(await asyncio.gather(*tasks))
+            except SolverUnavailable:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                log.error("❌ Remote GTO+ solver not available at %s", GTO_SOLVER_URL)
+                log.error("   Please check your Windows node connection")
+                return []
 
         # Create session summary
         self.debug_logger.create_session_summary(results)
 
-        print(
-            f"\n🎉 Completed GTO analysis for {len([r for r in results if r.get('status') == 'success'])} hands"
-        )
-
         # Sort by deviation score and show recommendations
         successful_results = [r for r in results if r.get("status") == "success"]
+        log.info("\n🎉 Completed GTO analysis for %s hands", len(successful_results))
+
         if successful_results:
             successful_results.sort(
                 key=lambda x: x.get("deviation_score", 0), reverse=True
             )
-            print(
-                f"\n🎯 Hands with highest deviations (recommended for ChatGPT analysis):"
+            log.info(
+                "\n🎯 Hands with highest deviations (recommended for ChatGPT analysis):"
             )
-            for i, result in enumerate(successful_results[:5]):
-                print(
-                    f"   {i+1}. Hand #{result['hand_id']} - Deviation: {result['deviation_score']:.2f}"
+            for i, result in enumerate(successful_results[:5], 1):
+                log.info(
+                    "   %s. Hand #%s - Deviation: %.2f",
+                    i,
+                    result["hand_id"],
+                    result["deviation_score"],
                 )
 
         return results
 
+    async def _process_gto_hand(
+        self, i: int, hand_file: HandFile, timestamp: str
+    ) -> Dict:
+        """Parse, solve and save a single hand file"""
+        log.info("\n📊 Processing GTO analysis %s: %s", i, hand_file.name)
+
+        try:
+            # Parse hand in a worker thread so the file read doesn't block the loop
+            hand_data = await asyncio.to_thread(
+                self.parser.parse_hand_file, hand_file.path, timestamp
+            )
+            log.info("   Hand ID: %s", hand_data.hand_id)
+
+            # Submit to solver
+            log.info("   🔄 Submitting to GTO+ solver...")
+            solver_result = await self.solver.submit_hand(hand_data)
+
+            if not solver_result:
+                log.error("   ❌ Solver analysis failed")
+                return {
+                    "hand_id": hand_data.hand_id,
+                    "status": "solver_failed",
+                    "error": "GTO+ solver returned no result",
+                }
+
+            log.info("   ✅ Solver completed in %.1fs", solver_result.processing_time)
+
+            # Save GTO-only results off the event loop so other hands keep flowing
+            result = await asyncio.to_thread(
+                self._save_gto_analysis, hand_data, solver_result
+            )
+
+            log.info("   ✅ GTO analysis saved to %s", result["output_file"])
+
+            # Calculate deviation score for prioritization
+            deviation_score = self._calculate_deviation_score(solver_result)
+            result["deviation_score"] = deviation_score
+            log.info("   📈 Deviation score: %.2f", deviation_score)
+
+            return result
+
+        except SolverUnavailable:
+            raise
+        except Exception as e:
+            log.error("   ❌ Error processing %s: %s", hand_file.path, e)
+            self.debug_logger.log_error(
+                "gto_processing",
+                hand_data.hand_id if "hand_data" in locals() else "unknown",
+                e,
+                {"filepath": hand_file.path},
+            )
+            return {
+                "hand_id": hand_data.hand_id if "hand_data" in locals() else "unknown",
+                "status": "error",
+                "error": str(e),
+            }
+
     def process_ai_analysis(
-        self, hand_ids: List[str] = None, min_deviation: float = 0.0
+        self,
+        hand_ids: List[str] = None,
+        min_deviation: float = 0.0,
+        max_workers: int = MAX_CONCURRENT_ANALYSES,
+        preloaded_results: Optional[List[Dict]] = None,
+        force: bool = False,
     ) -> List[Dict]:
-        """Step 2: Run AI analysis on selected hands or hands above deviation threshold"""
+        """Step 2: Run AI analysis on selected hands or hands above deviation threshold
+
+        preloaded_results takes the output of an earlier list_gto_results()
+        call so the exports folder isn't scanned again. Hands whose GTO result
+        was already analyzed unchanged are skipped unless force is set, which
+        also bypasses the cached ChatGPT response.
+        """
+        try:
+            return asyncio.run(
+                self._process_ai_analysis(
+                    hand_ids, min_deviation, max_workers, preloaded_results, force
+                )
+            )
+        finally:
+            self.debug_logger.flush()
+
+    async def _process_ai_analysis(
+        self,
+        hand_ids: Optional[List[str]],
+        min_deviation: float,
+        max_workers: int,
+        preloaded_results: Optional[List[Dict]] = None,
+        force: bool = False,
+    ) -> List[Dict]:
+        """Select hands from saved GTO results and analyze them concurrently"""
         if hand_ids:
-            print(f"🤖 Running AI analysis on {len(hand_ids)} selected hands...")
+            log.info("🤖 Running AI analysis on %s selected hands...", len(hand_ids))
         else:
-            print(
-                f"🤖 Running AI analysis on hands with deviation ≥ {min_deviation}..."
+            log.info(
+                "🤖 Running AI analysis on hands with deviation ≥ %s...", min_deviation
             )
 
         # Find GTO analysis files
-        gto_files = glob.glob(os.path.join(OUTPUT_FOLDER, "gto_analysis_*.json"))
-        results = []
+        if preloaded_results is not None:
+            gto_files = [result["filepath"] for result in preloaded_results]
+        else:
+            gto_files = _list_gto_files()
+        selected = []
 
-        processed_count = 0
         for filepath in gto_files:
             try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = _load_gto_json(filepath, os.path.getmtime(filepath))
 
                 hand_id = data["hand_data"]["hand_id"]
                 deviation_score = data.get("deviation_score", 0.0)
@@ -589,9 +936,14 @@ class GTOAssistant:
                 if not hand_ids and deviation_score < min_deviation:
                     continue
 
-                print(
-                    f"\n🤖 Processing AI analysis for Hand #{hand_id} (deviation: {deviation_score:.2f})"
-                )
+                # Skip GTO results whose exact contents were already analyzed
+                if not force and self._already_analyzed(filepath):
+                    log.info(
+                        "   ⏭️  Hand #%s already has AI analysis, skipping "
+                        "(use --force to re-run)",
+                        hand_id,
+                    )
+                    continue
 
                 # Reconstruct objects for AI analysis
                 hand_data = HandData(
@@ -601,7 +953,7 @@ class GTOAssistant:
                     game_type=data["hand_data"]["game_type"],
                     positions={},
                     actions=[],
-                    raw_history=data["hand_data"]["raw_history"],
+                    raw_history=self._load_raw_history(data["hand_data"]),
                 )
 
                 solver_result = SolverResult(
@@ -613,21 +965,19 @@ class GTOAssistant:
                     processing_time=data["solver_result"]["processing_time"],
                 )
 
-                # Run AI analysis
-                print("   🔄 Running ChatGPT analysis...")
-                ai_analysis = self.analyzer.analyze_hand(hand_data, solver_result)
-
-                # Save complete analysis
-                result = self._save_complete_analysis(
-                    hand_data, solver_result, ai_analysis, deviation_score
+                selected.append(
+                    (
+                        filepath,
+                        hand_data,
+                        solver_result,
+                        deviation_score,
+                        data["hand_data"].get("raw_history_path"),
+                        force,
+                    )
                 )
-                results.append(result)
-
-                processed_count += 1
-                print(f"   ✅ Complete analysis saved to {result['output_file']}")
 
             except Exception as e:
-                print(f"   ❌ Error processing AI analysis for {filepath}: {e}")
+                log.error("   ❌ Error processing AI analysis for %s: %s", filepath, e)
                 self.debug_logger.log_error(
                     "ai_processing",
                     hand_id if "hand_id" in locals() else "unknown",
@@ -636,18 +986,72 @@ class GTOAssistant:
                 )
                 continue
 
-        print(f"\n🎉 Completed AI analysis for {processed_count} hands")
+        results = []
+        if selected:
+            async with self.analyzer:
+                semaphore = asyncio.Semaphore(max_workers)
+
+                async def analyze_one(*args) -> Optional[Dict]:
+                    async with semaphore:
+                        return await self._process_ai_hand(*args)
+
+                outcomes = await asyncio.gather(*(analyze_one(*s) for s in selected))
+            results = [r for r in outcomes if r]
+
+        log.info("\n🎉 Completed AI analysis for %s hands", len(results))
         return results
 
+    async def _process_ai_hand(
+        self,
+        filepath: str,
+        hand_data: HandData,
+        solver_result: SolverResult,
+        deviation_score: float,
+        raw_history_path: Optional[str],
+        force: bool = False,
+    ) -> Optional[Dict]:
+        """Run ChatGPT analysis for one hand and save the complete result"""
+        log.info(
+            "\n🤖 Processing AI analysis for Hand #%s (deviation: %.2f)",
+            hand_data.hand_id,
+            deviation_score,
+        )
+
+        try:
+            # Run AI analysis
+            log.info("   🔄 Running ChatGPT analysis...")
+            ai_analysis = await self.analyzer.analyze_hand(
+                hand_data, solver_result, force
+            )
+
+            # Save complete analysis off the event loop
+            result = await asyncio.to_thread(
+                self._save_complete_analysis,
+                hand_data,
+                solver_result,
+                ai_analysis,
+                deviation_score,
+                raw_history_path,
+            )
+            log.info("   ✅ Complete analysis saved to %s", result["output_file"])
+            await asyncio.to_thread(self._mark_analyzed, filepath)
+            return result
+
+        except Exception as e:
+            log.error("   ❌ Error processing AI analysis for %s: %s", filepath, e)
+            self.debug_logger.log_error(
+                "ai_processing", hand_data.hand_id, e, {"filepath": filepath}
+            )
+            return None
+
     def list_gto_results(self, min_deviation: float = 0.0) -> List[Dict]:
         """List available GTO analysis results with deviation scores"""
-        gto_files = glob.glob(os.path.join(OUTPUT_FOLDER, "gto_analysis_*.json"))
+        gto_files = _list_gto_files()
         results = []
 
         for filepath in gto_files:
             try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = _load_gto_json(filepath, os.path.getmtime(filepath))
 
                 deviation_score = data.get("deviation_score", 0.0)
                 if deviation_score >= min_deviation:
@@ -657,46 +1061,109 @@ class GTOAssistant:
                             "stakes": data["hand_data"]["stakes"],
                             "deviation_score": deviation_score,
                             "processed_at": data["processed_at"],
+                            "display_time": data["processed_at"][:16].replace("T", " "),
                             "filepath": filepath,
                         }
                     )
             except Exception as e:
-                print(f"Error reading {filepath}: {e}")
+                log.error("Error reading %s: %s", filepath, e)
                 continue
 
         # Sort by deviation score
         results.sort(key=lambda x: x["deviation_score"], reverse=True)
         return results
 
+    @staticmethod
+    def _numeric_array(values) -> np.ndarray:
+        """Numeric values as a float array, skipping anything non-numeric"""
+        return np.fromiter(
+            (v for v in values if isinstance(v, (int, float))), dtype=np.float64
+        )
+
     def _calculate_deviation_score(self, solver_result: SolverResult) -> float:
         """Calculate a deviation score based on EV analysis and frequencies"""
-        deviation_score = 0.0
-
-        # Check EV analysis for significant losses
-        for metric, value in solver_result.ev_analysis.items():
-            if isinstance(value, (int, float)):
-                # Negative EV indicates suboptimal play
-                if value < 0:
-                    deviation_score += abs(value) * 10  # Scale the impact
-
-        # Check frequency deviations (simplified)
-        for action, freq in solver_result.frequencies.items():
-            if isinstance(freq, (int, float)):
-                # Look for extreme frequencies that might indicate interesting spots
-                if freq == 1.0 or freq == 0.0:
-                    deviation_score += 0.5  # Add points for pure strategies
-                elif 0.3 <= freq <= 0.7:
-                    deviation_score += 0.2  # Mixed strategies are interesting
-
-        return round(deviation_score, 2)
+        ev = self._numeric_array(solver_result.ev_analysis.values())
+        freqs = self._numeric_array(solver_result.frequencies.values())
+
+        return round(_dev_core(ev, freqs), 2)
+
+    @staticmethod
+    def _ai_sentinel(filepath: str) -> Path:
+        """Marker recording that a GTO result file has been AI-analyzed"""
+        return Path(OUTPUT_FOLDER) / f"{Path(filepath).name}.done"
+
+    @staticmethod
+    def _file_hash(filepath: str) -> str:
+        return blake3.blake3(Path(filepath).read_bytes()).hexdigest()
+
+    @classmethod
+    def _already_analyzed(cls, filepath: str) -> bool:
+        """Whether the GTO result is unchanged since its AI analysis
+
+        The marker stores the file's size, mtime and content hash. A matching
+        size and mtime is trusted as-is; the file is only read and hashed when
+        they differ (e.g. it was touched or copied).
+        """
+        try:
+            marker = orjson.loads(cls._ai_sentinel(filepath).read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return False
+
+        stat = os.stat(filepath)
+        if (
+            marker.get("size") == stat.st_size
+            and marker.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            return True
+
+        file_hash = cls._file_hash(filepath)
+        if marker.get("hash") != file_hash:
+            return False
+        # Same contents under a new mtime; refresh so the next check is cheap
+        cls._mark_analyzed(filepath, file_hash)
+        return True
+
+    @classmethod
+    def _mark_analyzed(cls, filepath: str, file_hash: Optional[str] = None):
+        stat = os.stat(filepath)
+        marker = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "hash": file_hash or cls._file_hash(filepath),
+        }
+        cls._ai_sentinel(filepath).write_bytes(orjson.dumps(marker))
+
+    @staticmethod
+    def _save_raw_history(hand_data: HandData, export_name: str) -> str:
+        """Write the hand history sidecar, returning its path under OUTPUT_FOLDER
+
+        The sidecar is named after the export it belongs to, so it is unique
+        whenever the export filename is.
+        """
+        stem = export_name.removesuffix(ARCHIVE_SUFFIX)
+        raw_history_path = f"{RAW_FOLDER}/{stem}.txt"
+        (Path(OUTPUT_FOLDER) / raw_history_path).write_bytes(
+            hand_data.raw_history.encode("utf-8")
+        )
+        return raw_history_path
+
+    @staticmethod
+    def _load_raw_history(saved_hand_data: dict) -> str:
+        """Hand history for a saved hand_data block, from its sidecar or inline"""
+        if "raw_history_path" in saved_hand_data:
+            path = Path(OUTPUT_FOLDER) / saved_hand_data["raw_history_path"]
+            return path.read_bytes().decode("utf-8")
+        return saved_hand_data.get("raw_history", "")
 
     def _save_gto_analysis(
         self, hand_data: HandData, solver_result: SolverResult
     ) -> Dict:
         """Save GTO-only analysis to file"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"gto_analysis_{hand_data.hand_id}_{timestamp}.json"
-        filepath = os.path.join(OUTPUT_FOLDER, filename)
+        now = datetime.now()
+        # Microseconds keep same-second saves of one hand id (e.g. "unknown") apart
+        timestamp = now.strftime("%Y%m%d_%H%M%S_%f")
+        filename = f"gto_analysis_{hand_data.hand_id}_{timestamp}{ARCHIVE_SUFFIX}"
+        filepath = Path(OUTPUT_FOLDER) / filename
 
         # Calculate deviation score before saving
         deviation_score = self._calculate_deviation_score(solver_result)
@@ -707,7 +1174,7 @@ class GTOAssistant:
                 "timestamp": hand_data.timestamp,
                 "stakes": hand_data.stakes,
                 "game_type": hand_data.game_type,
-                "raw_history": hand_data.raw_history,
+                "raw_history_path": self._save_raw_history(hand_data, filename),
             },
             "solver_result": {
                 "hand_id": solver_result.hand_id,
@@ -718,17 +1185,16 @@ class GTOAssistant:
                 "processing_time": solver_result.processing_time,
             },
             "deviation_score": deviation_score,
-            "processed_at": datetime.now().isoformat(),
+            "processed_at": now.isoformat(),
             "solver_url": GTO_SOLVER_URL,
             "analysis_type": "gto_only",
         }
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(analysis_data, f, indent=2)
+        _dump_archive(analysis_data, filepath)
 
         return {
             "hand_id": hand_data.hand_id,
-            "output_file": filepath,
+            "output_file": str(filepath),
             "status": "success",
             "deviation_score": deviation_score,  # Include in return value
         }
@@ -739,11 +1205,17 @@ class GTOAssistant:
         solver_result: SolverResult,
         ai_analysis: str,
         deviation_score: float,
+        raw_history_path: Optional[str] = None,
     ) -> Dict:
-        """Save complete analysis with both GTO and AI results"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"analysis_{hand_data.hand_id}_{timestamp}.json"
-        filepath = os.path.join(OUTPUT_FOLDER, filename)
+        """Save complete analysis with both GTO and AI results
+
+        The hand history sidecar saved with the GTO results is referenced
+        rather than rewritten; one is only written for older inline exports.
+        """
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S_%f")
+        filename = f"analysis_{hand_data.hand_id}_{timestamp}{ARCHIVE_SUFFIX}"
+        filepath = Path(OUTPUT_FOLDER) / filename
 
         analysis_data = {
             "hand_data": {
@@ -751,7 +1223,8 @@ class GTOAssistant:
                 "timestamp": hand_data.timestamp,
                 "stakes": hand_data.stakes,
                 "game_type": hand_data.game_type,
-                "raw_history": hand_data.raw_history,
+                "raw_history_path": raw_history_path
+                or self._save_raw_history(hand_data, filename),
             },
             "solver_result": {
                 "hand_id": solver_result.hand_id,
@@ -763,17 +1236,16 @@ class GTOAssistant:
             },
             "ai_analysis": ai_analysis,
             "deviation_score": deviation_score,
-            "processed_at": datetime.now().isoformat(),
+            "processed_at": now.isoformat(),
             "solver_url": GTO_SOLVER_URL,
             "analysis_type": "complete",
         }
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(analysis_data, f, indent=2)
+        _dump_archive(analysis_data, filepath)
 
         return {
             "hand_id": hand_data.hand_id,
-            "output_file": filepath,
+            "output_file": str(filepath),
             "status": "success",
         }
 
@@ -850,18 +1322,25 @@ def main():
         if ai_choice == "1":
             # Top 3 hands
             top_hands = [r["hand_id"] for r in gto_results[:3]]
-            assistant.process_ai_analysis(hand_ids=top_hands)
+            assistant.process_ai_analysis(
+                hand_ids=top_hands, preloaded_results=gto_results
+            )
 
         elif ai_choice == "2":
             # Threshold-based
             threshold = float(input("Enter minimum deviation score (e.g., 1.0): "))
-            assistant.process_ai_analysis(min_deviation=threshold)
+            assistant.process_ai_analysis(
+                min_deviation=threshold, preloaded_results=gto_results
+            )
 
         elif ai_choice == "3":
             # Manual selection
             hand_input = input("Enter hand IDs separated by commas: ")
             hand_ids = [h.strip() for h in hand_input.split(",")]
-            assistant.process_ai_analysis(hand_ids=hand_ids)
+            # Hands picked by id are re-run even if already analyzed
+            assistant.process_ai_analysis(
+                hand_ids=hand_ids, preloaded_results=gto_results, force=True
+            )
 
     elif choice == "3":
         # List results
@@ -875,11 +1354,13 @@ def main():
                 f"{'Hand ID':<12} {'Stakes':<10} {'Deviation':<10} {'Processed At':<20}"
             )
             print("-" * 60)
-            for result in results:
-                processed_time = result["processed_at"][:16].replace("T", " ")
-                print(
-                    f"{result['hand_id']:<12} {result['stakes']:<10} {result['deviation_score']:<10.2f} {processed_time:<20}"
-                )
+            # Emit the table in one write rather than a print per row
+            rows = [
+                f"{r['hand_id']:<12} {r['stakes']:<10} {r['deviation_score']:<10.2f} {r['display_time']:<20}"
+                for r in results
+            ]
+            sys.stdout.write("\n".join(rows) + "\n")
+            sys.stdout.flush()
 
             print(
                 f"\n💡 Hands with higher deviation scores are better candidates for AI analysis"
@@ -909,10 +1390,14 @@ def run_gto_only():
     return assistant.process_gto_analysis()
 
 
-def run_ai_analysis(hand_ids: List[str] = None, min_deviation: float = 0.0):
+def run_ai_analysis(
+    hand_ids: List[str] = None, min_deviation: float = 0.0, force: bool = False
+):
     """Helper function to run AI analysis on selected hands"""
     assistant = GTOAssistant()
-    return assistant.process_ai_analysis(hand_ids=hand_ids, min_deviation=min_deviation)
+    return assistant.process_ai_analysis(
+        hand_ids=hand_ids, min_deviation=min_deviation, force=force
+    )
 
 
 def list_gto_results(min_deviation: float = 0.0):
@@ -8,14 +8,39 @@ Usage:
     python gto_cli.py ai --top 3   # Run AI on top 3 hands by deviation
     python gto_cli.py ai --min 1.5 # Run AI on hands with deviation ≥ 1.5
     python gto_cli.py ai --hands "123,456" # Run AI on specific hands
+    python gto_cli.py ai --top 3 --force   # Re-run hands already analyzed
 """
 
 import argparse
+import os
 import sys
-from gto_assistant_preloaded import GTOAssistant
 
 
-def main():
+def _add_ai_arguments(ai_parser):
+    ai_group = ai_parser.add_mutually_exclusive_group(required=True)
+    ai_group.add_argument(
+        "--top", type=int, metavar="N", help="Analyze top N hands by deviation score"
+    )
+    ai_group.add_argument(
+        "--min",
+        type=float,
+        metavar="SCORE",
+        help="Analyze hands with deviation ≥ SCORE",
+    )
+    ai_group.add_argument(
+        "--hands",
+        type=str,
+        metavar="IDS",
+        help="Comma-separated hand IDs to analyze (always re-runs them)",
+    )
+    ai_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-run hands whose GTO result was already AI-analyzed",
+    )
+
+
+def _build_parser():
     parser = argparse.ArgumentParser(
         description="GTO Assistant - Cost-optimized poker analysis",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -41,27 +66,66 @@ def main():
 
     # AI analysis
     ai_parser = subparsers.add_parser("ai", help="Run AI analysis on selected hands")
-    ai_group = ai_parser.add_mutually_exclusive_group(required=True)
-    ai_group.add_argument(
-        "--top", type=int, metavar="N", help="Analyze top N hands by deviation score"
-    )
-    ai_group.add_argument(
-        "--min",
-        type=float,
-        metavar="SCORE",
-        help="Analyze hands with deviation ≥ SCORE",
-    )
-    ai_group.add_argument(
-        "--hands", type=str, metavar="IDS", help="Comma-separated hand IDs to analyze"
+    _add_ai_arguments(ai_parser)
+
+    return parser
+
+
+def _parse_gto(argv):
+    if argv:
+        return None
+    return argparse.Namespace(command="gto")
+
+
+def _parse_list(argv):
+    if len(argv) > 1:
+        return None
+    try:
+        min_deviation = float(argv[0]) if argv else 0.0
+    except ValueError:
+        return None
+    return argparse.Namespace(command="list", min_deviation=min_deviation)
+
+
+def _parse_ai(argv):
+    ai_parser = argparse.ArgumentParser(
+        prog=f"{os.path.basename(sys.argv[0])} ai",
+        description="Run AI analysis on selected hands",
     )
+    _add_ai_arguments(ai_parser)
+    args = ai_parser.parse_args(argv)
+    args.command = "ai"
+    return args
+
+
+COMMAND_PARSERS = {"gto": _parse_gto, "list": _parse_list, "ai": _parse_ai}
+
+
+def parse_args(argv):
+    """Dispatch on the command name, building only the arguments it needs
+
+    Help, a missing command and anything the fast paths don't recognise
+    go through the full parser so usage and error messages are unchanged.
+    """
+    if argv and argv[0] in COMMAND_PARSERS:
+        args = COMMAND_PARSERS[argv[0]](argv[1:])
+        if args is not None:
+            return args
+    return _build_parser().parse_args(argv)
 
-    args = parser.parse_args()
+
+def main():
+    args = parse_args(sys.argv[1:])
 
     if not args.command:
-        parser.print_help()
+        _build_parser().print_help()
         return
 
     try:
+        # Deferred so -h and argument errors don't pay for the assistant's
+        # import chain (OpenAI SDK, httpx, numba, ...)
+        from gto_assistant_preloaded import GTOAssistant
+
         assistant = GTOAssistant()
 
         if args.command == "gto":
@@ -95,11 +159,13 @@ def main():
                     f"\n{'Hand ID':<12} {'Stakes':<10} {'Deviation':<10} {'Processed At':<20}"
                 )
                 print("-" * 60)
-                for result in results:
-                    processed_time = result["processed_at"][:16].replace("T", " ")
-                    print(
-                        f"{result['hand_id']:<12} {result['stakes']:<10} {result['deviation_score']:<10.2f} {processed_time:<20}"
-                    )
+                # Emit the table in one write rather than a print per row
+                rows = [
+                    f"{r['hand_id']:<12} {r['stakes']:<10} {r['deviation_score']:<10.2f} {r['display_time']:<20}"
+                    for r in results
+                ]
+                sys.stdout.write("\n".join(rows) + "\n")
+                sys.stdout.flush()
 
                 print("\n💡 Run AI analysis:")
                 print(
@@ -116,18 +182,24 @@ def main():
                     print(f"⚠️  Only {len(gto_results)} hands available")
                 top_hands = [r["hand_id"] for r in gto_results[: args.top]]
                 if top_hands:
-                    assistant.process_ai_analysis(hand_ids=top_hands)
+                    # Reuse the listing instead of rescanning the exports folder
+                    assistant.process_ai_analysis(
+                        hand_ids=top_hands,
+                        preloaded_results=gto_results,
+                        force=args.force,
+                    )
                 else:
                     print("❌ No GTO results found. Run 'python gto_cli.py gto' first.")
 
-            elif args.min:
+            elif args.min is not None:
                 print(f"🤖 Running AI analysis on hands with deviation ≥ {args.min}...")
-                assistant.process_ai_analysis(min_deviation=args.min)
+                assistant.process_ai_analysis(min_deviation=args.min, force=args.force)
 
             elif args.hands:
                 hand_ids = [h.strip() for h in args.hands.split(",")]
                 print(f"🤖 Running AI analysis on hands: {hand_ids}")
-                assistant.process_ai_analysis(hand_ids=hand_ids)
+                # Explicitly requested hands are never skipped
+                assistant.process_ai_analysis(hand_ids=hand_ids, force=True)
 
     except ValueError as e:
         print(f"❌ Configuration error: {e}")
@@ -2,13 +2,16 @@
 """
 Test script to verify dotenv and OpenAI setup
 """
+
 import os
-from dotenv import load_dotenv
 
 print("Testing environment setup...")
 
-# Load .env file
-load_dotenv()
+# Load .env file, unless the shell already exports everything we check
+if not (os.environ.get("OPENAI_API_KEY") and os.environ.get("GTO_SOLVER_URL")):
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
 # Check environment variables
 api_key = os.getenv("OPENAI_API_KEY")
@@ -14,15 +14,65 @@ Examples:
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import orjson
 import time
 import sys
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import os
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables, unless the service URL is already exported
+if not os.environ.get("GTO_SOLVER_URL"):
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+# One keep-alive session for every test request
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=5))
+PRINT_LOCK = threading.Lock()
+
+# Largest JSON body that will be buffered for pretty-printing
+MAX_JSON_BYTES = 4 * 1024 * 1024
+
+# Hand used by the legacy analysis endpoint test
+MOCK_HAND_DATA = {
+    "hand_id": "remote_test_001",
+    "hand_history": """PokerStars Hand #123456789: Tournament #999999999, $10+$1 USD Hold'em No Limit - Level V (30/60) - 2024/01/01 12:00:00 ET
+Table '999999999 1' 9-max Seat #1 is the button
+Seat 1: Hero (1500 in chips)
+Seat 2: Villain (1500 in chips)
+Hero: posts small blind 30
+Villain: posts big blind 60
+*** HOLE CARDS ***
+Dealt to Hero [Ah Kh]
+Hero: raises 120 to 180
+Villain: calls 120
+*** FLOP *** [Kc 7d 2s]
+Villain: checks
+Hero: bets 240
+Villain: folds
+Hero collected 360 from pot
+*** SUMMARY ***
+Total pot 360 | Rake 0
+Board [Kc 7d 2s]
+Seat 1: Hero (button) (small blind) collected (360)
+Seat 2: Villain (big blind) folded on the Flop""",
+}
+
+# Scenario used by the GTO+ solve endpoint test
+GTO_SOLVE_DATA = {
+    "scenario": {
+        "position": "BTN",
+        "effective_stack": 100,
+        "pot_size": 3,
+        "board": [],
+        "action_sequence": ["raise", "call"],
+    },
+    "settings": {"accuracy": "medium", "max_time": 60},
+}
 
 
 def get_service_url(host=None, port=None):
@@ -43,51 +93,90 @@ def get_service_url(host=None, port=None):
 
 def test_endpoint(url, method="GET", data=None, expected_status=200, timeout=30):
     """Test a single API endpoint"""
-    print(f"\n{'='*60}")
-    print(f"Testing: {method} {url}")
-    print(f"{'='*60}")
+    # Buffer output so concurrent tests don't interleave their lines
+    out = []
+    out.append(f"\n{'='*60}")
+    out.append(f"Testing: {method} {url}")
+    out.append(f"{'='*60}")
+
+    try:
+        return _request_endpoint(url, method, data, expected_status, timeout, out)
+    finally:
+        with PRINT_LOCK:
+            print("\n".join(out))
+
 
+def _request_endpoint(url, method, data, expected_status, timeout, out):
     try:
+        # Stream the body so only as much of it as we print is read
         if method == "GET":
-            response = requests.get(url, timeout=timeout)
+            response = SESSION.get(url, timeout=timeout, stream=True)
         elif method == "POST":
-            response = requests.post(url, json=data, timeout=timeout)
+            response = SESSION.post(url, json=data, timeout=timeout, stream=True)
         else:
-            print(f"Unsupported method: {method}")
+            out.append(f"Unsupported method: {method}")
             return False
 
-        print(f"Status Code: {response.status_code}")
-
-        try:
-            json_response = response.json()
-            print(f"Response: {json.dumps(json_response, indent=2)}")
-        except (ValueError, json.JSONDecodeError):
-            print(f"Response Text: {response.text[:500]}...")
-
-        success = response.status_code == expected_status
-        print(f"Result: {'✅ PASS' if success else '❌ FAIL'}")
-        return success
+        with response:
+            out.append(f"Status Code: {response.status_code}")
+
+            if "json" in response.headers.get("Content-Type", ""):
+                body = _read_capped(response, MAX_JSON_BYTES)
+                try:
+                    # Parse and re-indent in C with a single orjson pass each way
+                    pretty = orjson.dumps(
+                        orjson.loads(body), option=orjson.OPT_INDENT_2
+                    )
+                    out.append(f"Response: {pretty.decode()}")
+                except orjson.JSONDecodeError:
+                    text = body[:500].decode("utf-8", errors="replace")
+                    out.append(f"Response Text: {text}...")
+            else:
+                text = response.raw.read(512, decode_content=True)
+                out.append(
+                    f"Response Text: {text[:500].decode('utf-8', errors='replace')}..."
+                )
+
+            success = response.status_code == expected_status
+            out.append(f"Result: {'✅ PASS' if success else '❌ FAIL'}")
+            return success
 
     except requests.exceptions.Timeout:
-        print(f"Request timed out after {timeout}s")
-        print("Result: ❌ FAIL (TIMEOUT)")
+        out.append(f"Request timed out after {timeout}s")
+        out.append("Result: ❌ FAIL (TIMEOUT)")
         return False
     except requests.exceptions.ConnectionError:
-        print("Connection failed - check if service is running and accessible")
-        print("Result: ❌ FAIL (CONNECTION)")
+        out.append("Connection failed - check if service is running and accessible")
+        out.append("Result: ❌ FAIL (CONNECTION)")
         return False
     except requests.exceptions.RequestException as e:
-        print(f"Request failed: {e}")
-        print("Result: ❌ FAIL")
+        out.append(f"Request failed: {e}")
+        out.append("Result: ❌ FAIL")
         return False
 
 
+def _read_capped(response, limit):
+    """Read a streamed response body, stopping once limit bytes are buffered"""
+    chunks = []
+    size = 0
+    for chunk in response.iter_content(chunk_size=8192):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return b"".join(chunks)[:limit]
+
+
 def test_connection(base_url):
     """Test basic connectivity to the service"""
     print(f"\n🔍 Testing connection to: {base_url}")
     try:
-        response = requests.get(f"{base_url}/health", timeout=5)
-        if response.status_code == 200:
+        # Only the status matters here, so avoid downloading the body
+        response = SESSION.head(f"{base_url}/health", timeout=5, allow_redirects=True)
+        if response.status_code == 405:
+            response = SESSION.get(f"{base_url}/health", timeout=5, stream=True)
+            response.close()
+        if response.ok:
             print("✅ Service is reachable")
             return True
         else:
@@ -122,62 +211,29 @@ def main():
     if not test_connection(base_url):
         sys.exit(1)
 
-    results = []
-
-    # Test 1: Service Health Check
+    specs = [
+        # Test 1: Service Health Check
+        (f"{base_url}/health", "GET", None, 30),
+        # Test 2: GTO+ Health Check
+        (f"{base_url}/gto/health", "GET", None, 30),
+        # Test 3: GTO+ Info
+        (f"{base_url}/gto/info", "GET", None, 30),
+        # Test 4: Legacy Mock Analysis
+        (f"{base_url}/api/analyze", "POST", MOCK_HAND_DATA, 30),
+        # Test 5: GTO+ Solve (if GTO+ is available)
+        (f"{base_url}/gto/solve", "POST", GTO_SOLVE_DATA, 90),
+    ]
+
+    # The probes are independent, so run them concurrently; total time is
+    # bounded by the slowest one (usually the solve) instead of the sum
     print("\n📊 Running API Tests...")
-    results.append(test_endpoint(f"{base_url}/health"))
-
-    # Test 2: GTO+ Health Check
-    results.append(test_endpoint(f"{base_url}/gto/health"))
-
-    # Test 3: GTO+ Info
-    results.append(test_endpoint(f"{base_url}/gto/info"))
-
-    # Test 4: Legacy Mock Analysis
-    print("\n🎯 Testing Legacy Analysis Endpoint...")
-    mock_hand_data = {
-        "hand_id": "remote_test_001",
-        "hand_history": """PokerStars Hand #123456789: Tournament #999999999, $10+$1 USD Hold'em No Limit - Level V (30/60) - 2024/01/01 12:00:00 ET
-Table '999999999 1' 9-max Seat #1 is the button
-Seat 1: Hero (1500 in chips)
-Seat 2: Villain (1500 in chips)
-Hero: posts small blind 30
-Villain: posts big blind 60
-*** HOLE CARDS ***
-Dealt to Hero [Ah Kh]
-Hero: raises 120 to 180
-Villain: calls 120
-*** FLOP *** [Kc 7d 2s]
-Villain: checks
-Hero: bets 240
-Villain: folds
-Hero collected 360 from pot
-*** SUMMARY ***
-Total pot 360 | Rake 0
-Board [Kc 7d 2s]
-Seat 1: Hero (button) (small blind) collected (360)
-Seat 2: Villain (big blind) folded on the Flop""",
-    }
-    results.append(test_endpoint(f"{base_url}/api/analyze", "POST", mock_hand_data))
-
-    # Test 5: GTO+ Solve (if GTO+ is available)
-    print("\n🧠 Testing GTO+ Solve Endpoint...")
-    print("Note: This requires GTO+ to be running on the Windows VM")
-
-    gto_solve_data = {
-        "scenario": {
-            "position": "BTN",
-            "effective_stack": 100,
-            "pot_size": 3,
-            "board": [],
-            "action_sequence": ["raise", "call"],
-        },
-        "settings": {"accuracy": "medium", "max_time": 60},
-    }
-    results.append(
-        test_endpoint(f"{base_url}/gto/solve", "POST", gto_solve_data, timeout=90)
-    )
+    print("Note: The GTO+ solve test requires GTO+ to be running on the Windows VM")
+    with ThreadPoolExecutor(max_workers=len(specs)) as executor:
+        futures = [
+            executor.submit(test_endpoint, url, method, data, 200, timeout)
+            for url, method, data, timeout in specs
+        ]
+        results = [future.result() for future in futures]
 
     # Summary
     print("\n" + "=" * 70)
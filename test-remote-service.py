@@ -2,10 +2,14 @@
 """
 Test script to verify communication with remote Windows GTO service
 """
+
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import sys
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Configuration from inventory.yml
@@ -13,12 +17,47 @@ WINDOWS_VM_IP = "192.168.15.234"
 SERVICE_PORT = 8080
 BASE_URL = f"http://{WINDOWS_VM_IP}:{SERVICE_PORT}"
 
+# One keep-alive session for every test request
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+# Hand used by the analysis endpoint test
+SAMPLE_HAND = {
+    "hand_id": "test_001",
+    "hand_history": """PokerStars Hand #123456789: Tournament #987654321, $10+$1 USD Hold'em No Limit - Level V (30/60) - 2024/01/15 20:30:00 ET
+Table '987654321 123' 9-max Seat #3 is the button
+Seat 1: Player1 (2850 in chips)
+Seat 2: Player2 (3200 in chips)
+Seat 3: Hero (2940 in chips)
+*** HOLE CARDS ***
+Dealt to Hero [Kh Ks]
+Player1: folds
+Player2: raises 120 to 180
+Hero: raises 300 to 480
+Player2: calls 300
+*** FLOP *** [9s 4h 2c]
+Player2: checks
+Hero: bets 600
+Player2: calls 600
+*** TURN *** [9s 4h 2c] [7d]
+Player2: checks
+Hero: bets 1200
+Player2: folds
+Hero collected 2160 from pot
+*** SUMMARY ***
+Total pot 2160 | Rake 0
+Board [9s 4h 2c 7d]
+Seat 1: Player1 folded before Flop (didn't bet)
+Seat 2: Player2 folded on the Turn
+Seat 3: Hero (button) collected (2160)""",
+}
+
 
 def test_health_endpoint():
     """Test the health endpoint"""
     print("🔍 Testing health endpoint...")
     try:
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
+        response = SESSION.get(f"{BASE_URL}/health", timeout=5)
         if response.status_code == 200:
             data = response.json()
             print("✅ Health check PASSED")
@@ -46,41 +85,9 @@ def test_analysis_endpoint():
     """Test the analysis endpoint with sample data"""
     print("\n🔍 Testing analysis endpoint...")
 
-    sample_hand = {
-        "hand_id": "test_001",
-        "hand_history": """PokerStars Hand #123456789: Tournament #987654321, $10+$1 USD Hold'em No Limit - Level V (30/60) - 2024/01/15 20:30:00 ET
-Table '987654321 123' 9-max Seat #3 is the button
-Seat 1: Player1 (2850 in chips)
-Seat 2: Player2 (3200 in chips)
-Seat 3: Hero (2940 in chips)
-*** HOLE CARDS ***
-Dealt to Hero [Kh Ks]
-Player1: folds
-Player2: raises 120 to 180
-Hero: raises 300 to 480
-Player2: calls 300
-*** FLOP *** [9s 4h 2c]
-Player2: checks
-Hero: bets 600
-Player2: calls 600
-*** TURN *** [9s 4h 2c] [7d]
-Player2: checks
-Hero: bets 1200
-Player2: folds
-Hero collected 2160 from pot
-*** SUMMARY ***
-Total pot 2160 | Rake 0
-Board [9s 4h 2c 7d]
-Seat 1: Player1 folded before Flop (didn't bet)
-Seat 2: Player2 folded on the Turn
-Seat 3: Hero (button) collected (2160)""",
-    }
-
     try:
         print(f"   Sending hand analysis request...")
-        response = requests.post(
-            f"{BASE_URL}/api/analyze", json=sample_hand, timeout=15
-        )
+        response = SESSION.post(f"{BASE_URL}/api/analyze", json=SAMPLE_HAND, timeout=15)
 
         if response.status_code == 200:
             data = response.json()
@@ -120,21 +127,44 @@ Seat 3: Hero (button) collected (2160)""",
         return False
 
 
-def test_performance():
-    """Test multiple requests to check performance"""
-    print("\n🔍 Testing performance (3 quick requests)...")
+def _timed_health_request():
+    """GET /health and return how long it took"""
+    start = time.perf_counter()
+    SESSION.get(f"{BASE_URL}/health", timeout=5)
+    return time.perf_counter() - start
+
+
+def test_performance(serial=False):
+    """Test multiple requests to check performance
+
+    The probes run concurrently by default to sample how the service
+    handles parallel connections; serial=True sends them one at a time
+    to measure plain request latency.
+    """
+    mode = "sequential" if serial else "concurrent"
+    print(f"\n🔍 Testing performance (3 quick {mode} requests)...")
 
     times = []
-    for i in range(3):
-        try:
-            start = time.time()
-            response = requests.get(f"{BASE_URL}/health", timeout=5)
-            elapsed = time.time() - start
-            times.append(elapsed)
-            print(f"   Request {i+1}: {elapsed:.3f}s")
-        except Exception as e:
-            print(f"   Request {i+1}: Failed - {e}")
-            return False
+    if serial:
+        for i in range(3):
+            try:
+                elapsed = _timed_health_request()
+                times.append(elapsed)
+                print(f"   Request {i+1}: {elapsed:.3f}s")
+            except Exception as e:
+                print(f"   Request {i+1}: Failed - {e}")
+                return False
+    else:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(_timed_health_request) for _ in range(3)]
+            for i, future in enumerate(futures):
+                try:
+                    elapsed = future.result()
+                    times.append(elapsed)
+                    print(f"   Request {i+1}: {elapsed:.3f}s")
+                except Exception as e:
+                    print(f"   Request {i+1}: Failed - {e}")
+                    return False
 
     avg_time = sum(times) / len(times)
     print(f"✅ Average response time: {avg_time:.3f}s")
@@ -143,6 +173,14 @@ def test_performance():
 
 def main():
     """Run all tests"""
+    parser = argparse.ArgumentParser(description="Test remote GTO service")
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Send the performance probes one at a time (latency only)",
+    )
+    args = parser.parse_args()
+
     print("=" * 60)
     print("🚀 GTO Service Connection Test")
     print("=" * 60)
@@ -155,7 +193,7 @@ def main():
 
     if health_ok:
         analysis_ok = test_analysis_endpoint()
-        perf_ok = test_performance()
+        perf_ok = test_performance(serial=args.serial)
 
         print("\n" + "=" * 60)
         if health_ok and analysis_ok and perf_ok:
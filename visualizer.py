@@ -7,13 +7,25 @@ Displays analysis in a ChatGPT-like interface with clean formatting.
 """
 
 import os
-import json
+import re
+import gzip
+import sys
+import argparse
+import threading
+import multiprocessing
 import glob
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from typing import NamedTuple
+from flask import Flask, render_template, request, send_from_directory
 from markupsafe import Markup
 import markdown
+import orjson
+import zstandard as zstd
 
 app = Flask(__name__)
 
@@ -21,21 +33,216 @@ app = Flask(__name__)
 OUTPUT_FOLDER = "exports"
 STATIC_FOLDER = "static"
 TEMPLATES_FOLDER = "templates"
+ANALYSIS_EXTENSIONS = (".json", ".json.zst")
+MAX_READ_WORKERS = 16
+STATIC_MAX_AGE = 3600  # seconds browsers may cache static assets
+SERVER_THREADS = 16
+
+# Response compression
+COMPRESS_MIMETYPES = {"application/json", "text/html"}
+COMPRESS_LEVEL = 4
+COMPRESS_MIN_SIZE = 500  # bytes; smaller bodies aren't worth compressing
+
+# Types treated as numeric solver values
+NUMERIC = (int, float)
+
+# Hand history patterns
+_DEALT_RE = re.compile(r"Dealt to (\w+) \[([^\]]+)\]")
+_SEAT_LINE_RE = re.compile(
+    r"Seat (?:#(?P<button>\d+) is the button|(?P<seat>\d+):(?: (?P<name>\w+))?)"
+)
+
+# Positions by seats from the button, for 6-max and full ring tables
+_POSITIONS = {
+    6: ("BTN", "SB", "BB", "UTG", "MP", "CO"),
+    9: ("BTN", "SB", "BB", "UTG", "UTG1", "MP", "MP1", "CO", "HJ"),
+}
+
+_HISTORY_LINE_RE = re.compile(r"[^\n]+")
+
+# Hand history line kinds, in priority order; the matching group's index
+# picks the CSS class
+_LINE_KIND_RE = re.compile(r"(Hand #)|.*?(Dealt to)|.*?(raises|calls|folds|wins)")
+_LINE_CLASSES = ("info-line", "hand-header", "dealt-cards", "action-line")
+
+# Suit letters to symbols; spaces are removed
+_SUIT_TRANS = str.maketrans({"s": "♠", "h": "♥", "d": "♦", "c": "♣", " ": None})
+
+# Complete analysis exports are named analysis_{hand_id}_{timestamp}
+_ANALYSIS_NAME_RE = re.compile(r"analysis_([^_]+)_")
+
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = STATIC_MAX_AGE
 
 # Create required directories
 Path(STATIC_FOLDER).mkdir(exist_ok=True)
 Path(TEMPLATES_FOLDER).mkdir(exist_ok=True)
 
 
+def find_analysis_files(prefix):
+    """Find export files starting with prefix, plain JSON or zstd-compressed"""
+    return [
+        path
+        for ext in ANALYSIS_EXTENSIONS
+        for path in glob.glob(os.path.join(OUTPUT_FOLDER, f"{prefix}*{ext}"))
+    ]
+
+
+# Newest complete analysis per hand id as (filename, ctime), rebuilt only
+# when the exports folder's own mtime changes (a file added or removed)
+_LATEST_INDEX = {"dir_mtime": None, "map": {}}
+
+
+def _latest_analyses():
+    try:
+        dir_mtime = os.stat(OUTPUT_FOLDER).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    if dir_mtime == _LATEST_INDEX["dir_mtime"]:
+        return _LATEST_INDEX["map"]
+
+    latest = {}
+    with os.scandir(OUTPUT_FOLDER) as entries:
+        for entry in entries:
+            name_match = _ANALYSIS_NAME_RE.match(entry.name)
+            if name_match and entry.name.endswith(ANALYSIS_EXTENSIONS):
+                hand_id = name_match.group(1)
+                ctime = entry.stat().st_ctime
+                if hand_id not in latest or ctime > latest[hand_id][1]:
+                    latest[hand_id] = (entry.name, ctime)
+
+    _LATEST_INDEX.update(dir_mtime=dir_mtime, map=latest)
+    return latest
+
+
+def find_latest_analysis(hand_id):
+    """Filename of the newest complete analysis for hand_id, or None"""
+    latest = _latest_analyses().get(hand_id)
+    return latest[0] if latest else None
+
+
+def read_analysis(filepath):
+    """Read an export file, decompressing .zst archives"""
+    with open(filepath, "rb") as f:
+        data = f.read()
+    if filepath.endswith(".zst"):
+        data = zstd.ZstdDecompressor().decompress(data)
+    return orjson.loads(data)
+
+
+def read_gto_analysis(filepath):
+    """Read a GTO export with its hand history sidecar loaded into hand_data"""
+    data = read_analysis(filepath)
+    hand_data = data.setdefault("hand_data", {})
+    hand_data["raw_history"] = load_raw_history(hand_data)
+    return data
+
+
+def _read_or_error(reader, filepath):
+    try:
+        return filepath, reader(filepath)
+    except Exception as e:
+        return filepath, e
+
+
+def read_analyses(filepaths, reader=read_analysis):
+    """Read export files concurrently with reader, yielding (filepath, data) in order
+
+    data is the exception instead when a file couldn't be read, so callers
+    can report it alongside their own per-file errors. At most
+    MAX_READ_WORKERS reads are in flight or waiting to be consumed, so a slow
+    consumer holds a bounded number of parsed files rather than all of them.
+    """
+    read = partial(_read_or_error, reader)
+    paths = iter(filepaths)
+    with ThreadPoolExecutor(max_workers=MAX_READ_WORKERS) as executor:
+        pending = deque(
+            executor.submit(read, path) for path in islice(paths, MAX_READ_WORKERS)
+        )
+        while pending:
+            result = pending.popleft().result()
+            # Refill the window before handing the result over
+            path = next(paths, None)
+            if path is not None:
+                pending.append(executor.submit(read, path))
+            yield result
+
+
+def json_response(obj):
+    """JSON response serialized with orjson instead of Flask's stdlib encoder"""
+    return app.response_class(orjson.dumps(obj), mimetype="application/json")
+
+
+def load_raw_history(hand_data):
+    """Hand history for an export's hand_data, from its sidecar file or inline"""
+    raw_history_path = hand_data.get("raw_history_path")
+    if raw_history_path:
+        path = Path(OUTPUT_FOLDER) / raw_history_path
+        return path.read_bytes().decode("utf-8")
+    return hand_data.get("raw_history", "")
+
+
+@lru_cache(maxsize=4096)
+def format_timestamp(processed_at):
+    """ISO processed_at timestamp as a display string, or unchanged if unparseable"""
+    try:
+        # fromisoformat only accepts a trailing Z from Python 3.11
+        if sys.version_info < (3, 11):
+            dt = datetime.fromisoformat(processed_at.replace("Z", "+00:00"))
+        else:
+            dt = datetime.fromisoformat(processed_at)
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
+    except:
+        return processed_at
+
+
+def _export_signature(*prefixes):
+    """(count, newest mtime) of export files starting with any of prefixes"""
+    count = 0
+    newest = 0
+    try:
+        entries = os.scandir(OUTPUT_FOLDER)
+    except FileNotFoundError:
+        return count, newest
+    with entries:
+        for entry in entries:
+            if entry.name.startswith(prefixes) and entry.name.endswith(
+                ANALYSIS_EXTENSIONS
+            ):
+                count += 1
+                newest = max(newest, entry.stat().st_mtime_ns)
+    return count, newest
+
+
+def _cached(cache, sig, build):
+    """Return cache's value for sig, rebuilding it when the signature changed"""
+    if cache["sig"] != sig:
+        cache["value"] = build()
+        cache["sig"] = sig
+    return cache["value"]
+
+
+# Loaded file lists, rebuilt only when the exports folder changes
+_ANALYSIS_CACHE = {"sig": None, "value": None}
+_GTO_CACHE = {"sig": None, "value": None}
+
+
 def load_analysis_files():
     """Load all analysis files from exports folder"""
-    analysis_files = glob.glob(os.path.join(OUTPUT_FOLDER, "analysis_*.json"))
+    return _cached(
+        _ANALYSIS_CACHE, _export_signature("analysis_"), _load_analysis_files
+    )
+
+
+def _load_analysis_files():
+    """Read every complete analysis export, most recent first"""
+    analysis_files = find_analysis_files("analysis_")
     analyses = []
 
-    for filepath in sorted(analysis_files, reverse=True):  # Most recent first
+    # Most recent first
+    for filepath, data in read_analyses(sorted(analysis_files, reverse=True)):
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            if isinstance(data, Exception):
+                raise data
 
             # Extract metadata
             filename = os.path.basename(filepath)
@@ -44,11 +251,7 @@ def load_analysis_files():
             processed_at = data.get("processed_at", "")
 
             # Parse timestamp for display
-            try:
-                dt = datetime.fromisoformat(processed_at.replace("Z", "+00:00"))
-                display_time = dt.strftime("%Y-%m-%d %H:%M:%S")
-            except:
-                display_time = processed_at
+            display_time = format_timestamp(processed_at)
 
             analyses.append(
                 {
@@ -57,7 +260,6 @@ def load_analysis_files():
                     "hand_id": hand_id,
                     "stakes": stakes,
                     "processed_at": display_time,
-                    "data": data,
                 }
             )
 
@@ -70,12 +272,10 @@ def load_analysis_files():
 
 def extract_hole_cards(raw_history):
     """Extract hole cards from raw hand history"""
-    import re
-
     # Look for pattern like "Dealt to Roughneck7 [8s 9s]"
-    dealt_match = re.search(r"Dealt to \w+ \[([^\]]+)\]", raw_history)
+    dealt_match = _DEALT_RE.search(raw_history)
     if dealt_match:
-        cards = dealt_match.group(1).strip()
+        cards = dealt_match.group(2).strip()
         # Format cards nicely (e.g., "8s 9s" -> "8♠9♠")
         return format_cards(cards)
     return "??"
@@ -83,89 +283,84 @@ def extract_hole_cards(raw_history):
 
 def extract_position(raw_history):
     """Extract position from raw hand history"""
-    import re
-
-    # Extract seat info and button position
-    lines = raw_history.split("\n")
-
-    # Find button position
-    button_match = re.search(r"Seat #(\d+) is the button", raw_history)
-    if not button_match:
-        return "??"
-
-    button_seat = int(button_match.group(1))
-
-    # Find hero's seat (player being dealt to)
-    hero_match = re.search(r"Dealt to (\w+)", raw_history)
+    # Find hero (player being dealt to)
+    hero_match = _DEALT_RE.search(raw_history)
     if not hero_match:
         return "??"
 
     hero_name = hero_match.group(1)
 
-    # Find hero's seat number
-    hero_seat_match = re.search(rf"Seat (\d+): {hero_name}", raw_history)
-    if not hero_seat_match:
-        return "??"
-
-    hero_seat = int(hero_seat_match.group(1))
+    # One pass over the seat lines for the button, hero's seat and seat count
+    button_seat = None
+    hero_seat = None
+    num_seats = 0
+    for seat_match in _SEAT_LINE_RE.finditer(raw_history):
+        if seat_match.group("button"):
+            if button_seat is None:
+                button_seat = int(seat_match.group("button"))
+            continue
+        num_seats += 1
+        if hero_seat is None and seat_match.group("name") == hero_name:
+            hero_seat = int(seat_match.group("seat"))
 
-    # Count total seats
-    seat_matches = re.findall(r"Seat \d+:", raw_history)
-    num_seats = len(seat_matches)
+    if button_seat is None or hero_seat is None:
+        return "??"
 
     # Calculate position relative to button
-    if num_seats == 6:  # 6-max
-        positions = ["BTN", "SB", "BB", "UTG", "MP", "CO"]
-    elif num_seats == 9:  # Full ring
-        positions = ["BTN", "SB", "BB", "UTG", "UTG1", "MP", "MP1", "CO", "HJ"]
-    else:
+    positions = _POSITIONS.get(num_seats)
+    if positions is None:
         return "??"
 
     # Calculate seats from button
-    seats_from_button = (hero_seat - button_seat) % num_seats
-
-    if seats_from_button < len(positions):
-        return positions[seats_from_button]
-
-    return "??"
+    return positions[(hero_seat - button_seat) % num_seats]
 
 
 def format_cards(cards_str):
     """Format card string with suit symbols"""
-    # Replace suit letters with symbols
-    cards_str = (
-        cards_str.replace("s", "♠")
-        .replace("h", "♥")
-        .replace("d", "♦")
-        .replace("c", "♣")
-    )
-    # Remove spaces between cards for more compact display
-    return cards_str.replace(" ", "")
+    # Replace suit letters with symbols and drop the spaces between cards
+    # for more compact display, in one pass
+    return cards_str.translate(_SUIT_TRANS)
 
 
 def load_gto_files():
     """Load all GTO analysis files from exports folder"""
-    gto_files = glob.glob(os.path.join(OUTPUT_FOLDER, "gto_analysis_*.json"))
-    complete_files = glob.glob(os.path.join(OUTPUT_FOLDER, "analysis_*.json"))
+    # has_ai_analysis depends on the complete analyses too
+    return _cached(
+        _GTO_CACHE,
+        _export_signature("gto_analysis_", "analysis_"),
+        _load_gto_files,
+    )
 
-    gto_analyses = []
-    complete_hand_ids = set()
 
-    # First, collect hand IDs that have complete analysis
+def _load_gto_files():
+    """Read every GTO analysis export, most recent first"""
+    return list(iter_gto_files())
+
+
+def iter_gto_files():
+    """Yield each GTO analysis export's summary, most recent first
+
+    Files are read lazily, so a caller can stream entries as they're loaded.
+    """
+    gto_files = find_analysis_files("gto_analysis_")
+    complete_files = find_analysis_files("analysis_")
+
+    # First, collect hand IDs that have complete analysis; the id is part of
+    # the filename, so there's no need to open the files
+    complete_hand_ids = set()
     for filepath in complete_files:
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            hand_id = data.get("hand_data", {}).get("hand_id", "unknown")
-            complete_hand_ids.add(hand_id)
-        except:
-            continue
+        name_match = _ANALYSIS_NAME_RE.match(os.path.basename(filepath))
+        if name_match:
+            complete_hand_ids.add(name_match.group(1))
 
     # Load GTO files and mark which have complete analysis
-    for filepath in sorted(gto_files, reverse=True):
+    # The hand history sidecars are read in the same pooled per-file load
+    for filepath, data in read_analyses(
+        sorted(gto_files, reverse=True), reader=read_gto_analysis
+    ):
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            if isinstance(data, Exception):
+                raise data
 
             # Extract metadata
             filename = os.path.basename(filepath)
@@ -182,71 +377,62 @@ def load_gto_files():
             frequencies = solver_result.get("frequencies", {})
 
             # Extract hole cards and position from raw_history
-            raw_history = data.get("hand_data", {}).get("raw_history", "")
+            raw_history = data["hand_data"]["raw_history"]
             hole_cards = extract_hole_cards(raw_history)
             position = extract_position(raw_history)
 
             # Calculate key metrics
-            total_ev = sum(
-                v for v in ev_analysis.values() if isinstance(v, (int, float))
-            )
-            max_freq = max(
-                (v for v in frequencies.values() if isinstance(v, (int, float))),
-                default=0.0,
-            )
+            total_ev = 0
+            for v in ev_analysis.values():
+                if isinstance(v, NUMERIC):
+                    total_ev += v
+            max_freq = None
+            for v in frequencies.values():
+                if isinstance(v, NUMERIC) and (max_freq is None or v > max_freq):
+                    max_freq = v
+            if max_freq is None:
+                max_freq = 0.0
 
             # Parse timestamp for display
-            try:
-                dt = datetime.fromisoformat(processed_at.replace("Z", "+00:00"))
-                display_time = dt.strftime("%Y-%m-%d %H:%M:%S")
-            except:
-                display_time = processed_at
+            display_time = format_timestamp(processed_at)
 
-            gto_analyses.append(
-                {
-                    "filename": filename,
-                    "filepath": filepath,
-                    "hand_id": hand_id,
-                    "stakes": stakes,
-                    "game_type": game_type,
-                    "processed_at": display_time,
-                    "deviation_score": deviation_score,
-                    "processing_time": processing_time,
-                    "total_ev": total_ev,
-                    "max_frequency": max_freq,
-                    "hole_cards": hole_cards,
-                    "position": position,
-                    "has_ai_analysis": hand_id in complete_hand_ids,
-                    "data": data,
-                }
-            )
+            yield {
+                "filename": filename,
+                "filepath": filepath,
+                "hand_id": hand_id,
+                "stakes": stakes,
+                "game_type": game_type,
+                "processed_at": display_time,
+                "deviation_score": deviation_score,
+                "processing_time": processing_time,
+                "total_ev": total_ev,
+                "max_frequency": max_freq,
+                "hole_cards": hole_cards,
+                "position": position,
+                "has_ai_analysis": hand_id in complete_hand_ids,
+            }
 
         except Exception as e:
             print(f"Error loading {filepath}: {e}")
             continue
 
-    return gto_analyses
-
 
 def format_hand_history(raw_history):
     """Format hand history for display"""
-    lines = raw_history.strip().split("\n")
     formatted = []
+    append = formatted.append
 
-    for line in lines:
-        line = line.strip()
+    # Walk the lines in place rather than splitting the history into a list;
+    # empty lines never match
+    for line_match in _HISTORY_LINE_RE.finditer(raw_history):
+        line = line_match.group().strip()
         if not line:
             continue
 
         # Highlight different types of actions
-        if line.startswith("Hand #"):
-            formatted.append(f'<div class="hand-header">{line}</div>')
-        elif "Dealt to" in line:
-            formatted.append(f'<div class="dealt-cards">{line}</div>')
-        elif any(action in line for action in ["raises", "calls", "folds", "wins"]):
-            formatted.append(f'<div class="action-line">{line}</div>')
-        else:
-            formatted.append(f'<div class="info-line">{line}</div>')
+        kind_match = _LINE_KIND_RE.match(line)
+        css_class = _LINE_CLASSES[kind_match.lastindex if kind_match else 0]
+        append(f'<div class="{css_class}">{line}</div>')
 
     return Markup("\n".join(formatted))
 
@@ -256,14 +442,19 @@ def format_ranges(ranges):
     if not ranges:
         return "No range data available"
 
-    formatted = []
-    for position, range_str in ranges.items():
-        formatted.append(f'<div class="range-item">')
-        formatted.append(f'  <span class="position">{position}:</span>')
-        formatted.append(f'  <span class="range">{range_str}</span>')
-        formatted.append(f"</div>")
+    return Markup(
+        "\n".join(
+            f'<div class="range-item">\n'
+            f'  <span class="position">{position}:</span>\n'
+            f'  <span class="range">{range_str}</span>\n'
+            f"</div>"
+            for position, range_str in ranges.items()
+        )
+    )
 
-    return Markup("\n".join(formatted))
+
+def _format_frequency(freq):
+    return f"{freq * 100:.1f}%" if isinstance(freq, NUMERIC) else str(freq)
 
 
 def format_frequencies(frequencies):
@@ -271,17 +462,35 @@ def format_frequencies(frequencies):
     if not frequencies:
         return "No frequency data available"
 
-    formatted = []
-    for action, freq in frequencies.items():
-        percentage = (
-            f"{freq * 100:.1f}%" if isinstance(freq, (int, float)) else str(freq)
+    return Markup(
+        "\n".join(
+            f'<div class="freq-item">\n'
+            f'  <span class="action">{action}:</span>\n'
+            f'  <span class="frequency">{_format_frequency(freq)}</span>\n'
+            f"</div>"
+            for action, freq in frequencies.items()
         )
-        formatted.append(f'<div class="freq-item">')
-        formatted.append(f'  <span class="action">{action}:</span>')
-        formatted.append(f'  <span class="frequency">{percentage}</span>')
-        formatted.append(f"</div>")
+    )
 
-    return Markup("\n".join(formatted))
+
+# Indexed by sign(value) + 1
+_EV_CLASSES = ("negative", "neutral", "positive")
+
+
+def _format_ev_item(metric, value):
+    if isinstance(value, NUMERIC):
+        display_value = f"{value:+.3f}" if value != 0 else "0.000"
+        color_class = _EV_CLASSES[(value > 0) - (value < 0) + 1]
+    else:
+        display_value = str(value)
+        color_class = "neutral"
+
+    return (
+        f'<div class="ev-item">\n'
+        f'  <span class="metric">{metric}:</span>\n'
+        f'  <span class="value {color_class}">{display_value}</span>\n'
+        f"</div>"
+    )
 
 
 def format_ev_analysis(ev_analysis):
@@ -289,23 +498,73 @@ def format_ev_analysis(ev_analysis):
     if not ev_analysis:
         return "No EV analysis available"
 
-    formatted = []
-    for metric, value in ev_analysis.items():
-        if isinstance(value, (int, float)):
-            display_value = f"{value:+.3f}" if value != 0 else "0.000"
-            color_class = (
-                "positive" if value > 0 else "negative" if value < 0 else "neutral"
-            )
-        else:
-            display_value = str(value)
-            color_class = "neutral"
+    return Markup(
+        "\n".join(
+            _format_ev_item(metric, value) for metric, value in ev_analysis.items()
+        )
+    )
 
-        formatted.append(f'<div class="ev-item">')
-        formatted.append(f'  <span class="metric">{metric}:</span>')
-        formatted.append(f'  <span class="value {color_class}">{display_value}</span>')
-        formatted.append(f"</div>")
 
-    return Markup("\n".join(formatted))
+class AnalysisBundle(NamedTuple):
+    """Everything the analysis views render for one export"""
+
+    hand_data: dict
+    solver_result: dict
+    formatted_hand: str
+    formatted_ranges: str
+    formatted_frequencies: str
+    formatted_ev: str
+    ai_analysis: Markup
+    processed_at: str
+    deviation_score: float
+
+
+@lru_cache(maxsize=512)
+def _bundle(filepath, mtime_ns):
+    """Parse an export once and format all of its sections, cached per file version"""
+    data = read_analysis(filepath)
+    hand_data = data.get("hand_data", {})
+    solver_result = data.get("solver_result", {})
+
+    # Format the AI analysis as markdown; GTO-only exports have none
+    ai_analysis = data.get("ai_analysis", "")
+    ai_analysis_html = Markup(markdown.markdown(ai_analysis) if ai_analysis else "")
+
+    return AnalysisBundle(
+        hand_data=hand_data,
+        solver_result=solver_result,
+        formatted_hand=format_hand_history(load_raw_history(hand_data)),
+        formatted_ranges=format_ranges(solver_result.get("ranges", {})),
+        formatted_frequencies=format_frequencies(solver_result.get("frequencies", {})),
+        formatted_ev=format_ev_analysis(solver_result.get("ev_analysis", {})),
+        ai_analysis=ai_analysis_html,
+        processed_at=data.get("processed_at", ""),
+        deviation_score=data.get("deviation_score", 0.0),
+    )
+
+
+@app.after_request
+def compress_response(response):
+    """Gzip JSON and HTML responses for clients that accept it"""
+    if (
+        response.mimetype not in COMPRESS_MIMETYPES
+        or response.status_code != 200
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        # Parsed with q-values, so "gzip;q=0" opts out and "*" opts in
+        or not request.accept_encodings["gzip"]
+    ):
+        return response
+
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+
+    response.set_data(gzip.compress(data, compresslevel=COMPRESS_LEVEL))
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
 
 
 @app.route("/")
@@ -331,33 +590,19 @@ def view_analysis(filename):
         return "Analysis not found", 404
 
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        # Format the AI analysis as markdown
-        ai_analysis = data.get("ai_analysis", "")
-        ai_analysis_html = Markup(markdown.markdown(ai_analysis))
-
-        # Format other data
-        hand_data = data.get("hand_data", {})
-        solver_result = data.get("solver_result", {})
-
-        formatted_hand = format_hand_history(hand_data.get("raw_history", ""))
-        formatted_ranges = format_ranges(solver_result.get("ranges", {}))
-        formatted_frequencies = format_frequencies(solver_result.get("frequencies", {}))
-        formatted_ev = format_ev_analysis(solver_result.get("ev_analysis", {}))
+        bundle = _bundle(filepath, os.stat(filepath).st_mtime_ns)
 
         return render_template(
             "analysis.html",
             filename=filename,
-            hand_data=hand_data,
-            solver_result=solver_result,
-            ai_analysis=ai_analysis_html,
-            formatted_hand=formatted_hand,
-            formatted_ranges=formatted_ranges,
-            formatted_frequencies=formatted_frequencies,
-            formatted_ev=formatted_ev,
-            processed_at=data.get("processed_at", ""),
+            hand_data=bundle.hand_data,
+            solver_result=bundle.solver_result,
+            ai_analysis=bundle.ai_analysis,
+            formatted_hand=bundle.formatted_hand,
+            formatted_ranges=bundle.formatted_ranges,
+            formatted_frequencies=bundle.formatted_frequencies,
+            formatted_ev=bundle.formatted_ev,
+            processed_at=bundle.processed_at,
         )
 
     except Exception as e:
@@ -373,60 +618,85 @@ def view_gto_analysis(filename):
         return "Analysis not found", 404
 
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        # Format data
-        hand_data = data.get("hand_data", {})
-        solver_result = data.get("solver_result", {})
-
-        formatted_hand = format_hand_history(hand_data.get("raw_history", ""))
-        formatted_ranges = format_ranges(solver_result.get("ranges", {}))
-        formatted_frequencies = format_frequencies(solver_result.get("frequencies", {}))
-        formatted_ev = format_ev_analysis(solver_result.get("ev_analysis", {}))
+        bundle = _bundle(filepath, os.stat(filepath).st_mtime_ns)
 
         return render_template(
             "gto_analysis.html",
             filename=filename,
-            hand_data=hand_data,
-            solver_result=solver_result,
-            formatted_hand=formatted_hand,
-            formatted_ranges=formatted_ranges,
-            formatted_frequencies=formatted_frequencies,
-            formatted_ev=formatted_ev,
-            processed_at=data.get("processed_at", ""),
-            deviation_score=data.get("deviation_score", 0.0),
+            hand_data=bundle.hand_data,
+            solver_result=bundle.solver_result,
+            formatted_hand=bundle.formatted_hand,
+            formatted_ranges=bundle.formatted_ranges,
+            formatted_frequencies=bundle.formatted_frequencies,
+            formatted_ev=bundle.formatted_ev,
+            processed_at=bundle.processed_at,
+            deviation_score=bundle.deviation_score,
         )
 
     except Exception as e:
         return f"Error loading GTO analysis: {e}", 500
 
 
+def _ai_worker(hand_queue):
+    """Run queued AI analyses in one long-lived process"""
+    # Import here to avoid circular imports
+    from gto_assistant_preloaded import GTOAssistant
+
+    assistant = None
+    while True:
+        hand_id = hand_queue.get()
+        try:
+            if assistant is None:
+                assistant = GTOAssistant()
+            # A trigger is an explicit request, so re-run analyzed hands too
+            assistant.process_ai_analysis(hand_ids=[hand_id], force=True)
+        except Exception as e:
+            print(f"Error running AI analysis for hand {hand_id}: {e}")
+
+
+# AI analysis worker process and its job queue, started on first use
+_AI_WORKER = {"process": None, "queue": None}
+_AI_WORKER_LOCK = threading.Lock()
+
+
+def queue_ai_analysis(hand_id):
+    """Queue a hand for AI analysis, starting the worker if it isn't running
+
+    The worker imports the assistant once and serves every request, instead
+    of paying interpreter startup for a gto_cli subprocess per hand.
+    """
+    with _AI_WORKER_LOCK:
+        process = _AI_WORKER["process"]
+        if process is None or not process.is_alive():
+            # Spawn rather than fork: forking the threaded server can leave
+            # locks held and hands the child its logging configuration
+            context = multiprocessing.get_context("spawn")
+            hand_queue = context.Queue()
+            process = context.Process(
+                target=_ai_worker, args=(hand_queue,), daemon=True
+            )
+            process.start()
+            _AI_WORKER.update(process=process, queue=hand_queue)
+        _AI_WORKER["queue"].put(hand_id)
+
+
 @app.route("/api/trigger_ai/<hand_id>", methods=["POST"])
 def trigger_ai_analysis(hand_id):
     """Trigger AI analysis for a specific hand"""
     try:
-        # Import here to avoid circular imports
-        import subprocess
-        import sys
-
         # Find the GTO analysis file for this hand
-        gto_files = glob.glob(
-            os.path.join(OUTPUT_FOLDER, f"gto_analysis_{hand_id}_*.json")
-        )
+        gto_files = find_analysis_files(f"gto_analysis_{hand_id}_")
         if not gto_files:
-            return jsonify({"error": f"No GTO analysis found for hand {hand_id}"}), 404
+            return (
+                json_response({"error": f"No GTO analysis found for hand {hand_id}"}),
+                404,
+            )
 
-        # Use the CLI to trigger AI analysis
-        cmd = [sys.executable, "gto_cli.py", "ai", "--hands", hand_id]
-
-        # Run in background
-        process = subprocess.Popen(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
+        # Hand off to the background worker
+        queue_ai_analysis(hand_id)
 
         # Don't wait for completion, return immediately
-        return jsonify(
+        return json_response(
             {
                 "status": "started",
                 "message": f"AI analysis started for hand {hand_id}",
@@ -435,46 +705,36 @@ def trigger_ai_analysis(hand_id):
         )
 
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}), 500
 
 
 @app.route("/api/find_analysis/<hand_id>")
 def find_analysis_file(hand_id):
     """Find the analysis file for a specific hand ID"""
     try:
-        # Look for complete analysis files for this hand
-        analysis_files = glob.glob(
-            os.path.join(OUTPUT_FOLDER, f"analysis_{hand_id}_*.json")
-        )
+        # Look for the most recent complete analysis file for this hand
+        filename = find_latest_analysis(hand_id)
 
-        if analysis_files:
-            # Return the most recent one
-            latest_file = max(analysis_files, key=os.path.getctime)
-            filename = os.path.basename(latest_file)
-            return jsonify(
+        if filename:
+            return json_response(
                 {"found": True, "filename": filename, "url": f"/analysis/{filename}"}
             )
         else:
-            return jsonify({"found": False})
+            return json_response({"found": False})
 
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}), 500
 
 
 @app.route("/api/check_ai_status/<hand_id>")
 def check_ai_status(hand_id):
     """Check if AI analysis is complete for a hand"""
     try:
-        # Check if complete analysis file exists
-        analysis_files = glob.glob(
-            os.path.join(OUTPUT_FOLDER, f"analysis_{hand_id}_*.json")
-        )
+        # Check if complete analysis file exists, finding the most recent one
+        filename = find_latest_analysis(hand_id)
 
-        if analysis_files:
-            # Find the most recent one
-            latest_file = max(analysis_files, key=os.path.getctime)
-            filename = os.path.basename(latest_file)
-            return jsonify(
+        if filename:
+            return json_response(
                 {
                     "status": "complete",
                     "filename": filename,
@@ -482,17 +742,17 @@ def check_ai_status(hand_id):
                 }
             )
         else:
-            return jsonify({"status": "pending"})
+            return json_response({"status": "pending"})
 
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}), 500
 
 
 @app.route("/api/analyses")
 def api_analyses():
     """API endpoint for analysis list"""
     analyses = load_analysis_files()
-    return jsonify(
+    return json_response(
         [
             {
                 "filename": a["filename"],
@@ -505,35 +765,65 @@ def api_analyses():
     )
 
 
+def _gto_summary(a):
+    """Public fields of a load_gto_files() entry"""
+    return {
+        "hand_id": a["hand_id"],
+        "stakes": a["stakes"],
+        "game_type": a["game_type"],
+        "hole_cards": a["hole_cards"],
+        "position": a["position"],
+        "deviation_score": a["deviation_score"],
+        "processing_time": a["processing_time"],
+        "total_ev": a["total_ev"],
+        "max_frequency": a["max_frequency"],
+        "has_ai_analysis": a["has_ai_analysis"],
+        "processed_at": a["processed_at"],
+        "filename": a["filename"],
+    }
+
+
 @app.route("/api/gto_analyses")
 def api_gto_analyses():
-    """API endpoint for GTO analysis list"""
-    gto_analyses = load_gto_files()
-    return jsonify(
-        [
-            {
-                "hand_id": a["hand_id"],
-                "stakes": a["stakes"],
-                "game_type": a["game_type"],
-                "hole_cards": a["hole_cards"],
-                "position": a["position"],
-                "deviation_score": a["deviation_score"],
-                "processing_time": a["processing_time"],
-                "total_ev": a["total_ev"],
-                "max_frequency": a["max_frequency"],
-                "has_ai_analysis": a["has_ai_analysis"],
-                "processed_at": a["processed_at"],
-                "filename": a["filename"],
-            }
-            for a in gto_analyses
-        ]
+    """API endpoint for GTO analysis list
+
+    Clients that send "Accept: application/x-ndjson" get one JSON object
+    per line, streamed as each file is read (or from the cached list when
+    it's current); everyone else gets a JSON array.
+    """
+    accepted = request.accept_mimetypes.best_match(
+        ["application/json", "application/x-ndjson"]
     )
+    if accepted == "application/x-ndjson":
+        sig = _export_signature("gto_analysis_", "analysis_")
+        gto_analyses = _GTO_CACHE["value"] if _GTO_CACHE["sig"] == sig else None
+
+        def stream():
+            if gto_analyses is not None:
+                for a in gto_analyses:
+                    yield orjson.dumps(_gto_summary(a)) + b"\n"
+                return
+
+            # Read as the client consumes, and keep the rows for the cache once
+            # the whole listing has been sent
+            rows = []
+            for a in iter_gto_files():
+                rows.append(a)
+                yield orjson.dumps(_gto_summary(a)) + b"\n"
+            _GTO_CACHE.update(value=rows, sig=sig)
+
+        return app.response_class(stream(), mimetype="application/x-ndjson")
+
+    return json_response([_gto_summary(a) for a in load_gto_files()])
 
 
 @app.route("/static/<path:filename>")
 def serve_static(filename):
     """Serve static files"""
-    return send_from_directory(STATIC_FOLDER, filename)
+    # Conditional GET lets browsers revalidate with a 304 instead of a re-download
+    return send_from_directory(
+        STATIC_FOLDER, filename, conditional=True, max_age=STATIC_MAX_AGE
+    )
 
 
 # Templates are now stored as external files in templates/ folder
@@ -544,6 +834,14 @@ def serve_static(filename):
 
 def main():
     """Run the visualizer"""
+    parser = argparse.ArgumentParser(description="GTO Analysis Visualizer")
+    parser.add_argument(
+        "--dev",
+        action="store_true",
+        help="Use Flask's debug server with auto-reload instead of waitress",
+    )
+    args = parser.parse_args()
+
     print("🎨 GTO Analysis Visualizer")
     print("=" * 40)
 
@@ -563,7 +861,13 @@ def main():
     print()
 
     try:
-        app.run(host="0.0.0.0", port=8081, debug=True)
+        if args.dev:
+            app.run(host="0.0.0.0", port=8081, debug=True)
+        else:
+            # Threaded server so concurrent page loads read exports in parallel
+            from waitress import serve
+
+            serve(app, host="0.0.0.0", port=8081, threads=SERVER_THREADS)
     except KeyboardInterrupt:
         print("\n👋 Visualizer stopped")
 